@@ -1,11 +1,39 @@
-import math
+# Import lru_cache to memoize the luby numbers already computed
+from functools import lru_cache
 
-# List to store the luby numbers
-l=[]
+@lru_cache(maxsize=None)
+def luby(i):
+    """
+    Method to get the luby number at the index i (0 based)
+    of the sequence. It keeps no state, the caller keeps
+    the index of the next number it needs.
+
+    Parameters:
+        i: the index (0 based) of the luby number
+
+    Return:
+        the luby number at the index i in the sequence
+    """
+
+    # Use the 1 based index and its bit length k
+    i += 1
+    k = i.bit_length()
 
-# Values that help to generate the Luby Sequence
-mult = 1
-minu = 0
+    if ((i+1) & i) == 0:
+        # If the index (1 based) is of the form 2^k-1
+        # (i.e. i+1 is a power of 2), the luby number
+        # is 2^(k-1)
+        return 1<<(k-1)
+
+    # Else the luby number is same as that at the
+    # index (1 based) i-2^(k-1)+1, where 2^(k-1) is the
+    # largest power of 2 <= i (the memoized call
+    # gets the 0 based index)
+    return luby(i-(1<<(k-1)))
+
+# Index of the next luby number to be returned by
+# get_next_luby_number (used by the SAT.ipynb notebook)
+_pos = 0
 
 def get_next_luby_number():
     """
@@ -13,38 +41,17 @@ def get_next_luby_number():
 
     Parameters:
         None
-    
+
     Return:
         the next Luby number in the sequence
     """
 
-    # Use the global variables
-    global l
-    global mult
-    global minu
-
-    size = len(l)
-
-    # Index of the element to be generated,
-    # pused into the list and returned
-    to_fill = size+1
-
-    if math.log(to_fill+1,2).is_integer():
-        # If the index is of the form 2^K -1,
-        # push mult into the queue and double it
-        # for the next push
-        l.append(mult)
-        mult *= 2
-
-        # This helps to fill the other indices
-        minu = size+1
-    else:
-        # If the index is not of the form 2^K-1,
-        # then the luby number is same as that at
-        # the index to_fill-minu-1
-        l.append(l[to_fill-minu-1])
-    
-    return l[size]
+    # Use the global variable
+    global _pos
+
+    number = luby(_pos)
+    _pos += 1
+    return number
 
 def reset_luby():
     """
@@ -53,16 +60,13 @@ def reset_luby():
 
     Parameters:
         None
-    
+
     Return:
         None
-    """ 
-    # Use the global variables
-    global l
-    global mult
-    global minu
+    """
+
+    # Use the global variable
+    global _pos
 
     # Reset it for the next use
-    l=[]
-    mult=1
-    minu=0
\ No newline at end of file
+    _pos = 0
@@ -1,9 +1,139 @@
+from array import array
+
+def _sift_down(prio,elem,indices,node_index,size):
+    """
+    Moves the node at node_index down the heap (stored in the
+    parallel arrays prio and elem) till both its children have
+    a priority not greater than it.
+
+    Parameters:
+        prio: array of the priorities of the nodes in the heap
+        elem: array of the elements of the nodes in the heap
+        indices: array mapping the elements to their indices in the heap
+        node_index: index in the heap of the node to be moved down
+        size: number of nodes in the heap
+
+    Return:
+        None
+    """
+
+    # Nothing to do if the node is not in the heap
+    # (eg. the heap became empty)
+    if node_index>=size:
+        return
+
+    # The node which moves down the heap. Its position is
+    # treated as a hole into which the larger child is moved
+    # at every level and the node is written only once at
+    # its final position
+    node_pr = prio[node_index]
+    node = elem[node_index]
+
+    # Only the nodes before half have children
+    # (2*i+1 < size is same as i < size//2)
+    half = size >> 1
+
+    while node_index<half:
+        left_index = (node_index<<1)|1
+
+        # Pick the child with the larger priority
+        # (the boolean is added as 0/1 so the right child
+        # is picked only if it exists and is bigger)
+        right_index = left_index+1
+        child_index = left_index + (right_index<size and prio[right_index]>prio[left_index])
+
+        if prio[child_index]<=node_pr:
+            # If the larger child is not bigger than the
+            # node, the node can be placed in the hole
+            break
+
+        # Move the child up into the hole (and update its
+        # index in the indices array) and continue from the child
+        child = elem[child_index]
+        prio[node_index] = prio[child_index]
+        elem[node_index] = child
+        indices[child-1] = node_index
+        node_index = child_index
+
+    # Place the node in the final hole
+    prio[node_index] = node_pr
+    elem[node_index] = node
+    indices[node-1] = node_index
+
+def _sift_up(prio,elem,indices,node_index):
+    """
+    Moves the node at node_index up the heap (stored in the
+    parallel arrays prio and elem) till its parent has a
+    priority not smaller than it.
+
+    Parameters:
+        prio: array of the priorities of the nodes in the heap
+        elem: array of the elements of the nodes in the heap
+        indices: array mapping the elements to their indices in the heap
+        node_index: index in the heap of the node to be moved up
+
+    Return:
+        None
+    """
+
+    # The node which moves up the heap. Its position is
+    # treated as a hole into which the parent is moved
+    # at every level and the node is written only once at
+    # its final position
+    node_pr = prio[node_index]
+    node = elem[node_index]
+
+    while node_index!=0:
+        par = (node_index-1) >> 1
+        if prio[par]>=node_pr:
+            # If the parent is not smaller than the
+            # node, the node can be placed in the hole
+            break
+
+        # Move the parent down into the hole (and update its
+        # index in the indices array) and continue from the parent
+        parent = elem[par]
+        prio[node_index] = prio[par]
+        elem[node_index] = parent
+        indices[parent-1] = node_index
+        node_index = par
+
+    # Place the node in the final hole
+    prio[node_index] = node_pr
+    elem[node_index] = node
+    indices[node-1] = node_index
+
+def _build_heap(prio,elem,indices,size):
+    """
+    Converts the parallel arrays prio and elem into a max heap
+    in linear time.
+
+    Parameters:
+        prio: array of the priorities of the nodes
+        elem: array of the elements of the nodes
+        indices: array mapping the elements to their indices in the arrays
+        size: number of nodes
+
+    Return:
+        None
+    """
+
+    # This is the basic method to convert an array into
+    # heap (by calling sift down in reverse order from first
+    # half elements)
+    for i in range((size >> 1)-1,-1,-1):
+        _sift_down(prio,elem,indices,i,size)
 
 class PriorityQueue:
     """
     Class to implement the Priority Queue.
     """
 
+    # The attributes are fixed, so they are stored in slots
+    # (rather than in a per object dictionary) which makes
+    # their lookups in the heap methods faster
+    __slots__ = ("size","prio","elem","indices")
+
     def __init__(self,start_list):
         """
         Constructor of the priority queue class.
@@ -19,33 +149,23 @@ class PriorityQueue:
         # The first element is removed as it is not related
         # to any variable or literal
         self.size = len(start_list)-1
-        temp = start_list[1:]
 
-        # Array that stores the heap
-        # Each element in the heap is of the form
-        # [priority,element] where priority is the
-        # priority of the element and the heap is
-        # max heap with respect to the priority scores
-        self.heap = []
+        # The heap is stored as two parallel arrays,
+        # prio[i] is the priority of the element elem[i]
+        # at the position i in the heap and the heap is
+        # max heap with respect to the priority scores.
+        # Initially, the element ctr (1 based) with the
+        # priority start_list[ctr] is at position ctr-1
+        self.prio = start_list[1:]
+        self.elem = list(range(1,self.size+1))
 
         # Array that maps elements to their indices
-        # in the heap
-        self.indices = []
-
-        ctr = 1
-        for x in temp:
-            # For all elements in the array,
-            # push the [priority,ctr] pair in
-            # the heap
-            self.heap.append([x,ctr])
-            self.indices.append(ctr-1)
-            ctr += 1
-        
-        # This is the basic method to convert an array into
-        # heap (by calling heapify in reverse order from first
-        # half elements)
-        for i in range(int(self.size/2)-1,-1,-1):
-            self.heapify(i)
+        # in the heap (stored as a typed array of C ints
+        # as it has one entry for every element)
+        self.indices = array("i",range(0,self.size))
+
+        # Convert the arrays into a heap
+        _build_heap(self.prio,self.elem,self.indices,self.size)
     
     def swap(self,ind1,ind2):
         """
@@ -59,22 +179,23 @@ class PriorityQueue:
             None
         """
 
-        # Swap the nodes in the heap array
-        temp = self.heap[ind1]
-        self.heap[ind1] = self.heap[ind2]
-        self.heap[ind2] = temp
+        # Swap the nodes in the heap arrays
+        temp = self.prio[ind1]
+        self.prio[ind1] = self.prio[ind2]
+        self.prio[ind2] = temp
+        temp = self.elem[ind1]
+        self.elem[ind1] = self.elem[ind2]
+        self.elem[ind2] = temp
 
         # Swap the indices of the nodes
         # in the indices array as the nodes
         # swapped and so their indices also must
         # be swapped
-        p1 = self.heap[ind1][1]
+        p1 = self.elem[ind1]
         p1 -= 1
-        p2 = self.heap[ind2][1]
+        p2 = self.elem[ind2]
         p2 -= 1
-        temp = self.indices[p1]
-        self.indices[p1]=self.indices[p2]
-        self.indices[p2]=temp
+        self.indices[p1],self.indices[p2] = self.indices[p2],self.indices[p1]
 
     def heapify(self,node_index):
         """
@@ -90,40 +211,7 @@ class PriorityQueue:
             None
         """
 
-        # Calculate the max priority between the node,
-        # its left and its right child
-
-        maxp = self.heap[node_index][0]
-
-        left_index = 2*node_index+1
-        if left_index<self.size:
-            pr = self.heap[left_index][0]
-            if pr>maxp:
-                maxp = pr
-        
-        right_index = 2*node_index+2
-        if right_index<self.size:
-            pr = self.heap[right_index][0]
-            if pr>maxp:
-                maxp = pr
-        
-        if maxp != self.heap[node_index][0]:
-            # If max priority is not of root
-
-            if left_index<self.size and maxp == self.heap[left_index][0]:
-                # If max priority is of the left node,
-                # swap left node with root node 
-                # and recursively call heapify on the left node
-                # to make it a nax heap
-                self.swap(left_index,node_index)
-                self.heapify(left_index)
-            else:
-                # If max priority is of the right node,
-                # swap right node with root node 
-                # and recursively call heapify on the right node
-                # to make it a nax heap
-                self.swap(right_index,node_index)
-                self.heapify(right_index)
+        _sift_down(self.prio,self.elem,self.indices,node_index,self.size)
 
     def get_top(self):
         """
@@ -136,20 +224,31 @@ class PriorityQueue:
             -1 if queue is empty else the element with the highest priority
         """
 
+        # Use locals to avoid repeated attribute lookups
+        prio = self.prio
+        elem = self.elem
+        indices = self.indices
+        size = self.size
+
         # If queue is empty, return -1
-        if self.size == 0:
+        if size == 0:
             return -1
 
-        # Top element is the element in heap[0]
-        top_element = self.heap[0][1]
-
-        # To remove the first element, we swap it with the last
-        # element, reduce size of queue by 1 and call
-        # heapify(0) to maintain the heap structure
-        self.swap(0,self.size-1)
-        self.indices[self.heap[self.size-1][1]-1]=-1
-        self.size -= 1
-        self.heapify(0)
+        # Top element is the element in elem[0]
+        top_element = elem[0]
+
+        # To remove the first element, we move the last
+        # element to the root (the popped element is not
+        # kept in the heap arrays), reduce size of queue by 1
+        # and sift down the new root to maintain the heap structure
+        size -= 1
+        last_element = elem[size]
+        prio[0] = prio[size]
+        elem[0] = last_element
+        indices[last_element-1] = 0
+        indices[top_element-1] = -1
+        self.size = size
+        _sift_down(prio,elem,indices,0,size)
 
         return top_element
 
@@ -164,7 +263,7 @@ class PriorityQueue:
             None
         """
         print("Size: ",self.size)
-        print("Heap: ",self.heap[:self.size])
+        print("Heap: ",list(zip(self.prio[:self.size],self.elem[:self.size])))
         print("Indices: ",self.indices)
 
     
@@ -180,27 +279,20 @@ class PriorityQueue:
         Return:
             None
         """
-        if self.indices[key-1] == -1:
-            return
-        
         pos = self.indices[key-1]
+        if pos == -1:
+            return
         
         # Increase its priority by value
-        self.heap[pos][0] += value
+        prio = self.prio
+        prio[pos] += value
 
         # To maintain the heap structure, traverse the heap 
         # from this node upwards and replace it with its parent 
         # till its parent is bigger than it. 
         # (This is needed as increasing the priority
         # can disrupt the heap structure)
-        par=pos
-        while par!=0:
-            temp = par
-            par = int((par-1)/2)
-            if self.heap[temp][0] > self.heap[par][0]:
-                self.swap(temp,par)
-            else:
-                break
+        _sift_up(prio,self.elem,self.indices,pos)
     
     def remove(self,key):
         """
@@ -212,17 +304,28 @@ class PriorityQueue:
         Return:
             None
         """
-        if self.indices[key-1] == -1:
+        # Use locals to avoid repeated attribute lookups
+        prio = self.prio
+        elem = self.elem
+        indices = self.indices
+
+        pos = indices[key-1]
+        if pos == -1:
             return
 
         # Replace the node to be deleted with 
         # the final node
-        pos = self.indices[key-1]
-        this_node_pr = self.heap[pos][0]
-        final_node_pr = self.heap[self.size-1][0]
-        self.swap(pos,self.size-1)
-        self.size -= 1
-        self.indices[key-1] = -1
+        last = self.size-1
+        this_node_pr = prio[pos]
+        final_node_pr = prio[last]
+        final_element = elem[last]
+        prio[pos] = final_node_pr
+        prio[last] = this_node_pr
+        elem[pos] = final_element
+        elem[last] = key
+        indices[final_element-1] = pos
+        indices[key-1] = -1
+        self.size = last
 
 
         if final_node_pr > this_node_pr:
@@ -231,19 +334,26 @@ class PriorityQueue:
             # and replace the node with its parent unti 
             # its parent is bigger than it. This is done to 
             # maintain the heap structure.
-            par = pos
-            while par!=0:
-                temp = par
-                par = int((par-1)/2)
-                if self.heap[temp][0] > self.heap[par][0]:
-                    self.swap(temp,par)
-                else:
-                    break
+            _sift_up(prio,elem,indices,pos)
         elif this_node_pr > final_node_pr:
             # If replaced node has a lower priority than the 
             # removed node,then use heapify to maintain the
             # heap structure
-            self.heapify(pos)
+            _sift_down(prio,elem,indices,pos,last)
+
+    def contains(self,key):
+        """
+        Method to check whether the element key is in the queue.
+
+        Parameters:
+            key: the element to be checked
+        
+        Return:
+            True if key is in the priority queue, else False
+        """
+
+        # The index of an element not in the heap is -1
+        return self.indices[key-1] != -1
 
     def add(self,key,value):
         """
@@ -258,13 +368,83 @@ class PriorityQueue:
             None
         """
 
-        # Push the key to the last position with priority 0
-        self.heap[self.size] = [0,key]
-        self.indices[key-1] = self.size
+        # Push the key to the last position with priority value
+        prio = self.prio
+        elem = self.elem
+        indices = self.indices
+        size = self.size
+        prio[size] = value
+        elem[size] = key
+        indices[key-1] = size
 
         # Increase the heap size
-        self.size += 1
+        self.size = size+1
 
-        # Call the increase update method to increase
-        # the priority of key from 0 to value
-        self.increase_update(key,value)
\ No newline at end of file
+        # Move the key up to maintain the heap structure
+        _sift_up(prio,elem,indices,size)
+
+    def add_all(self,keys,values):
+        """
+        Method to add the elements in keys (with the priorities
+        in values) into the priority queue. If more elements are
+        added than are already in the queue (eg. after a restart),
+        the whole heap is rebuilt in linear time instead of adding
+        the elements one at a time.
+
+        Parameters:
+            keys: list of the elements to be added in the priority queue
+            values: list of the priority values of the elements (values[i]
+                    is the priority of keys[i])
+
+        Return:
+            None
+        """
+
+        prio = self.prio
+        elem = self.elem
+        indices = self.indices
+        size = self.size
+
+        if len(keys) <= size:
+            # Few elements are added, so add them one by one
+            # (each moved up in the heap)
+            for i in range(0,len(keys)):
+                key = keys[i]
+                prio[size] = values[i]
+                elem[size] = key
+                indices[key-1] = size
+                _sift_up(prio,elem,indices,size)
+                size += 1
+            self.size = size
+            return
+
+        # Place all the elements after the elements in the heap
+        # and update their indices
+        new_size = size+len(keys)
+        prio[size:new_size] = values
+        elem[size:new_size] = keys
+        for i in range(size,new_size):
+            indices[elem[i]-1] = i
+        self.size = new_size
+
+        # Rebuild the heap from all the elements
+        _build_heap(prio,elem,indices,new_size)
+
+    def decay_all(self,factor):
+        """
+        Method to multiply the priorities of all the elements
+        in the priority queue by factor. As all the priorities
+        are scaled by the same positive factor, the heap
+        structure is maintained.
+
+        Parameters:
+            factor: the positive value by which all the priorities are multiplied
+
+        Return:
+            None
+        """
+        # Scale the priorities of the nodes in the heap in one
+        # pass over the array (the slots after size are not in
+        # the heap and are overwritten when elements are added)
+        size = self.size
+        self.prio[:size] = [p*factor for p in self.prio[:size]]
@@ -22,18 +22,20 @@
 # In[1]:
 
 
+import io
 import os
-import sys
 import time
+import re
 import json
 import random
-from collections import OrderedDict
+from array import array
+from collections import Counter
 
 # Import the Priority Queue class from PriorityQueue.py file
 from PriorityQueue import PriorityQueue
 
-# Import the Luby Sequence Generator methods from LubyGenerator.py file
-from LubyGenerator import reset_luby, get_next_luby_number
+# Import the Luby Sequence Generator method from LubyGenerator.py file
+from LubyGenerator import luby
 
 
 # In[2]:
@@ -120,128 +122,60 @@ class Statistics:
         # Time which the solver spend while backtracking
         self._backtrack_time = 0
         
+        # Whether the time spent in each phase (the time breakup)
+        # was measured
+        self._is_profiled = False
+        
         # Number of restarts
         self._restarts = 0
+        
+        # Number of learned clauses removed from the clause database
+        self._num_deleted_clauses = 0
     
-    def print_stats(self):
+    def print_stats(self,file=None):
         '''
         Method to print the statistics.
         
         Arguments:
-            None
+            file: the file object the statistics are written to
+                  (the standard output if it is None)
             
         Return:
             None
         '''
         
         # Print the stored statistics with appropriate labels of what the stats signify
-        print("=========================== STATISTICS ===============================")
-        print("Solving formula from file: ",self._input_file)
-        print("Vars:{}, Clauses:{} Stored Clauses:{}".format(str(self._num_vars),str(self._num_orig_clauses),str(self._num_clauses)))
-        print("Input Reading Time: ",self._read_time - self._start_time)
-        print("-------------------------------")
-        print("Restarts: ",self._restarts)
-        print("Learned clauses: ",self._num_learned_clauses)
-        print("Decisions made: ",self._num_decisions)
-        print("Implications made: ",self._num_implications)
-        print("Time taken: ",self._complete_time-self._start_time)
-        print("----------- Time breakup ----------------------")
-        print("BCP Time: ",self._bcp_time)
-        print("Decide Time: ",self._decide_time)
-        print("Conflict Analyze Time: ",self._analyze_time)
-        print("Backtrack Time: ",self._backtrack_time)
-        print("-------------------------------")
-        print("RESULT: ",self._result)
-        print("Statistics stored in file: ",self._output_statistics_file)
+        print("=========================== STATISTICS ===============================",file=file)
+        print("Solving formula from file: ",self._input_file,file=file)
+        print("Vars:{}, Clauses:{} Stored Clauses:{}".format(self._num_vars,self._num_orig_clauses,self._num_clauses),file=file)
+        print("Input Reading Time: ",self._read_time - self._start_time,file=file)
+        print("-------------------------------",file=file)
+        print("Restarts: ",self._restarts,file=file)
+        print("Learned clauses: ",self._num_learned_clauses,file=file)
+        print("Deleted clauses: ",self._num_deleted_clauses,file=file)
+        print("Decisions made: ",self._num_decisions,file=file)
+        print("Implications made: ",self._num_implications,file=file)
+        print("Time taken: ",self._complete_time-self._start_time,file=file)
+        print("----------- Time breakup ----------------------",file=file)
+        
+        # The time breakup is only available if it was measured
+        if self._is_profiled:
+            print("BCP Time: ",self._bcp_time,file=file)
+            print("Decide Time: ",self._decide_time,file=file)
+            print("Conflict Analyze Time: ",self._analyze_time,file=file)
+            print("Backtrack Time: ",self._backtrack_time,file=file)
+        else:
+            print("Not measured (profiling is off)",file=file)
+        print("-------------------------------",file=file)
+        print("RESULT: ",self._result,file=file)
+        print("Statistics stored in file: ",self._output_statistics_file,file=file)
         
         # Check if the result of the problem is
         # SAT and if it is, then show the
         # assignement file name
         if self._result == "SAT":
-            print("Satisfying Assignment stored in file: ",self._output_assignment_file)
-        print("======================================================================")  
-
-
-# In[3]:
-
-
-class AssignedNode:
-    """
-    Class used to store the information about the variables being assigned.
-    
-    Public Attributes:
-        var: variable that is assigned
-        value: value assigned to the variable (True/False)
-        level: level (decision level in the tree) at which the variable is assigned
-        clause: The id of the clause which implies this decision (If this is assigned through implication) 
-        index: The index in the assignment stack at which this node is pushed
-    
-    Public Methods:
-        None
-    """
-    
-    def __init__(self,var,value,level,clause): 
-        '''
-        Constructor for the AssignedNode class.
-        
-        Arguments:
-            var: variable that is assigned
-            value: value assigned to the variable (True/False)
-            level: level (decision level in the tree) at which the variable is assigned
-            clause: The id of the clause which implies this decision (If this is assigned through implication) 
-            
-        Return:
-            initialized AssignedNode object
-        '''
-        
-        # Variable that is assigned 
-        self.var = var
-        
-        # Value assigned to the variable (True/False)
-        self.value = value
-        
-        # Level at which the variable is assigned
-        self.level = level   
-        
-        # The index of the clause which implies the variable var if var is assigned through Implication
-        # If var is decided, this is set to None
-        self.clause = clause 
-        
-        # Index at which a node is placed in the assignment stack
-        # Initially it is -1 when node is created and has to be
-        # updated when pushed in assignment_stack.
-        self.index = -1
-    
-    def __str__(self):
-        '''
-        Method to get the string representation of the AssignedNode object.
-        
-        Parameters:
-            None
-        
-        Return:
-            a string that has the information about this node
-        '''
-        
-        return_string = ""
-        
-        # Add variable info
-        return_string += "Var: {} ".format(self.var)
-        
-        # Add value info
-        return_string += "Val: {} ".format(self.value)
-        
-        # Add level info
-        return_string += "Lev: {} ".format(self.level)
-        
-        # Add clause info
-        return_string += "Cls: {} ".format(self.clause)
-        
-        # Add index info
-        return_string += "Ind: {} ".format(self.index)
-        
-        # Return the final string
-        return return_string
+            print("Satisfying Assignment stored in file: ",self._output_assignment_file,file=file)
+        print("======================================================================",file=file)
 
 
 # # Input File Format
@@ -253,9 +187,11 @@ class AssignedNode:
 # 1 -3 0 <br>
 # 2 3 -1 0 <br>
 # 
-# The lines starting with 'c' are the comments. The line starting with 'p' has the number of variables and the number of clauses after "cnf". Like, in the above example, there are 3 variables and 2 clauses. The next lines of the file are the clauses. Each clause ends with 0. In the input format, each variable is defined by a number. So, we have literals like 1, -2, 3 and so on. Let there be V number of variables. Positive literals are like 1,2,3,4...V and we store them like this only. For the negative literals, -1,-2,..-V, we will add V to its absolute value. That is, -1,-2,-3 ... -V will be represented by V+1,V+2..V+V. 
+# The lines starting with 'c' are the comments. The line starting with 'p' has the number of variables and the number of clauses after "cnf". Like, in the above example, there are 3 variables and 2 clauses. The next lines of the file are the clauses. Each clause ends with 0. In the input format, each variable is defined by a number. So, we have literals like 1, -2, 3 and so on. Let there be V number of variables. We store the literals in the same way as MiniSAT does. The positive literal of the variable v is represented by 2v and the negative literal -v is represented by 2v+1. That is, 1,2,3 ... V are represented by 2,4,6..2V and -1,-2,-3 ... -V are represented by 3,5,7..2V+1. So, the variable of a literal l is l>>1 (shift right by 1), the literal is negative if l&1 is 1 and the complement of l is l^1.
+# 
+# For eg. if we have 3 variables 1,2 and 3. Then the clause (1,-2,3) will be stored as (2,5,6) as -2 is replaced by 2*2+1=5
 # 
-# For eg. if we have 3 variables 1,2 and 3. Then the clause (1,-2,3) will be stored as (1,5,3) as -2 is replaced by 2+3=5
+# The clauses are not stored as separate lists. All the literals of all the clauses are stored one after the other in a single flat integer array and a second array stores the offset at which every clause starts (the clause c occupies the positions from offset[c] till offset[c+1]). The duplicate literals of a clause are removed by stamping every literal seen in the clause (in an array indexed by the literals) with a number unique to the clause and skipping the ones already stamped.
 # <hr style="border:2px solid gray"> </hr>
 # 
 # # 2-Watched Literals to fasten BCP
@@ -263,6 +199,8 @@ class AssignedNode:
 # Studies show that majority of the times, the SAT solver performs the Boolean Constraint Propogation (BCP) which is responsible for making implications after performing propogation once a variable is decided. A naive approach for doing so would be that whenever a variable is set, we traverse each clause and find such clauses where all but 1 literals have been falsed. This would be very expensive as we will have to traverse all the literals every time a decision is made. And as many decisions are made, BCP is indeed an important step and should be done faster.
 # 
 # To fasten the BCP, we observe that if for any clause, we have 2 literals that are not set false, then it can not pariticipate in BCP at this step. This is because as both the literals are not false, then either atleast one is true which means that the clause is already valid and can not be used to conclude anything or both are not set, which means that there are atleast two literals not defined and thus we can not say anything about the clause at this step. So, for all clauses, we keep 2 watch literals all the time with the invariant that each of them is not false if the clause is not satisfied. Now, whenever we set a variable, say 2 as in the above example and we set it to true. This means that the literal -2 (5) has been falsed and so we only go to clauses watched by -2 and search for a new watcher for them. If we get a new watcher for them, then it is fine. Else we are left with only one undecided literal in it (the other watcher) as we get no watcher (not false literal) which means all other literals have been falsed and so the only undecided literal left is the other watcher and that is now implied.
+# 
+# The two watchers of a clause are always kept at the first two positions of the clause and finding a new watcher swaps it with the falsed watcher. The watches of every literal are kept in a linked list stored in two flat arrays (the head of the list for every literal and the next watch for every watch), so a clause changes its watcher by just relinking its watch from the list of the falsed literal to the list of the new watcher, without copying or searching any list.
 # <hr style="border:2px solid gray"> </hr>
 # 
 # # Decision Heuristics
@@ -271,11 +209,11 @@ class AssignedNode:
 # 
 # 1. **ORDERED:** As seen above, the variables are represented as numbers 1,2,3 and so on. So, in this ordered decider, we pick the smallest (comparing the numbers representing the variables) unassigned variable and set it to True. To implement it, we traverse the list 1,2,3 .. V in this order and take the first variable which is unassigned and assign it True.
 # 
-# 2. **VSIDS:** In the VSIDS (Variable State Independent Decaying Sum) like strategy, we prefer the literals that recently participated in the conflict resolution and set them first. We create an array of size 2\*number of variables to store the scores of all literals and initialize it with all 0s. While reading the input file, the score of a literal is incremented by 1 whenever it appears in a clause. When ever a conflict occurs and a conflict cluase is created, we increase the score of all literals in that conflict clause by _incr (which is 1 initially) and _incr is increased by 0.75 after each conflict clause creation. This is done to give more weightage to the literals participating in the recent conflicts. While deciding, the unassigned literal with the highest score is chosen and is satisfied (if it is -v, v is set to False and if it is v, v is set to True)
+# 2. **VSIDS:** In the VSIDS (Variable State Independent Decaying Sum) like strategy, we prefer the literals that recently participated in the conflict resolution and set them first. We create an array of size 2\*number of variables to store the scores of all literals and initialize it with all 0s. While reading the input file, the score of a literal is incremented by 1 whenever it appears in a clause. When ever a conflict occurs and a conflict cluase is created, we increase the score of all literals in that conflict clause by _incr (which is 1 initially) and _incr is increased by 0.75 after each conflict clause creation. This is done to give more weightage to the literals participating in the recent conflicts. While deciding, the unassigned literal with the highest score is chosen and is satisfied (if it is -v, v is set to False and if it is v, v is set to True). If its variable was assigned before, it is set to its last assigned value instead (phase-saving, as described for MINISAT below), so that a restart or a backjump does not throw away the values found earlier.
 # 
-# 3. **MINISAT:** This is the heuristic as used by the MINISAT solver. It is on the lines of VSIDS with some modifications. Here, we maintain the score array for all variables (rather than the literals) and intialize the scores to 0. We also maintain a phase array which stores the last truth value assigned to each variable (whenever a variable is assigned, this phase array is updated). While reading the input file, the score of a variable is incremented by 1 whenever a literal corresponding to it appears in a clause. When ever a conflict occurs and a conflict cluase is created, we increase the score of all variables whose literals appear in that conflict clause by _incr (which is 1 initially) and _incr is divided by _decay (0.85) after each conflict clause creation. This is done to give more weightage to the variables participating in the recent conflicts. While deciding, the unassigned variable with the highest score is fixed. It is assigned the value it was assigned previously as stored in the phase array. This is called **phase-saving**. Phase-saving is beneficial as in a sense we are restarting the search for the solution of the problem by assigning the variable with the same value again. Conflicts that occured after this variable's assignment earlier lead to learning of conflict clauses which will now help in avoiding these conflict situations.
+# 3. **MINISAT:** This is the heuristic as used by the MINISAT solver. It is on the lines of VSIDS with some modifications. Here, we maintain the score array for all variables (rather than the literals) and intialize the scores to 0. We also maintain a phase array which stores the last truth value assigned to each variable (the value of a variable is saved in this phase array when the variable is unassigned while backtracking, which is the last value it was assigned). While reading the input file, the score of a variable is incremented by 1 whenever a literal corresponding to it appears in a clause. When ever a conflict occurs and a conflict cluase is created, we increase the score of all variables whose literals appear in that conflict clause by _incr (which is 1 initially) and _incr is divided by _decay (0.85) after each conflict clause creation. This is done to give more weightage to the variables participating in the recent conflicts. While deciding, the unassigned variable with the highest score is fixed. It is assigned the value it was assigned previously as stored in the phase array. This is called **phase-saving**. Phase-saving is beneficial as in a sense we are restarting the search for the solution of the problem by assigning the variable with the same value again. Conflicts that occured after this variable's assignment earlier lead to learning of conflict clauses which will now help in avoiding these conflict situations.
 # 
-# To implement the VSIDS and MINISAT heuristic, we implemented a PriorityQueue (in the file [PriorityQueue.py](PriorityQueue.py)) which has efficient methods to add a variable in the queue, increase the score of a variable in the queue, removing the variable from the queue (when assigned) and getting the variable with maximum score from the queue. All these are written efficiently taking O(log(n)) time. The working of the methods can be seen from the PriorityQueue.py which has been fully documented as well.
+# To implement the VSIDS and MINISAT heuristic, we implemented a PriorityQueue (in the file [PriorityQueue.py](PriorityQueue.py)) which has efficient methods to add a variable in the queue, increase the score of a variable in the queue and getting (popping) the variable with maximum score from the queue. All these are written efficiently taking O(log(n)) time. A variable is not removed from the queue when it is assigned (lazy deletion): it stays in the queue and the decide method pops and skips the assigned variables till it gets an unassigned one. When the variables are unassigned while backtracking, only the ones popped by decide are added back to the queue. The working of the methods can be seen from the PriorityQueue.py which has been fully documented as well.
 # <hr style="border:2px solid gray"> </hr>
 # 
 # 
@@ -313,7 +251,7 @@ class SAT:
         and solves it
     """
     
-    def __init__(self,to_log,decider,restarter=None):
+    def __init__(self,to_log,decider,restarter=None,profile=False):
         '''
         Constructor for the SAT class
         
@@ -324,6 +262,8 @@ class SAT:
             to be assigned to it in the _decide method
             restarter: the restart strategy to be used by the SAT solver (None set by default, so if nothing is
             passed, restarting will not be used) 
+            profile: a boolean (True/False) which indicates whether the solver should measure the time spent
+            in each phase (BCP, decide, analyze and backtrack) (False set by default)
         
         Return:
             initialized SAT object
@@ -337,30 +277,91 @@ class SAT:
         # Decision level (level at which the solver is in backtracking tree)
         self._level = 0
         
-        # List of clauses where each clause is stored as a list of
-        # literals as explained above.
-        self._clauses = []
-        
-        # Dictionary mapping a literal to the list of clauses the literal watches
-        self._clauses_watched_by_l = {}
-        
-        # Dictionary mapping a clause to the list of literals that watch the clause
-        self._literals_watching_c = {}
-        
-        # Dictionary mapping the variables to their assignment nodes
-        # which contains the information about the value of the variable,
-        # the clause which implied the variable (if it is implied) and 
-        # the level at which the variable is set
-        self._variable_to_assignment_nodes = {}
-        
-        # A stack(list) that stores the assignment nodes in order
-        # of their assignment
-        self._assignment_stack = []
+        # The clauses stored in the CSR format as explained above.
+        # _clause_lits has the literals of all the clauses one after the other
+        # and the literals of the clause with id c are stored in
+        # _clause_lits[_clause_off[c]:_clause_off[c+1]]
+        self._clause_lits = array("i")
+        self._clause_off = array("i",[0])
+        
+        # The two literals watching a clause are always kept at the
+        # positions 0 and 1 of the clause. The watch of the clause with id c
+        # by the literal at position w (0 or 1) is called the watch cell 2*c+w.
+        # The watch cells of a literal form a linked list:
+        # _watch_head[l] is the first watch cell of the literal l (-1 if none)
+        # and _watch_next[cell] is the watch cell after cell in its list (-1 at the end).
+        # (_watch_head is created once the number of variables is known)
+        self._watch_head = []
+        self._watch_next = []
+        
+        # _watch_blocker[cell] is a literal of the clause of cell (other than the
+        # watching literal) called the blocker. If the blocker is true, the clause
+        # is satisfied and BCP skips the cell without reading the clause.
+        self._watch_blocker = []
+        
+        # The information about the assignment of the variables is stored in
+        # separate arrays indexed by the variable (created once the number of
+        # variables is known):
+        # _assign_value[v] is the value assigned to v (1 for True, 0 for False
+        # and -1 if v is not assigned)
+        # _assign_level[v] is the level at which v is assigned
+        # _assign_reason[v] is the id of the clause which implied v (-1 if v is
+        # decided or implied by a unary clause)
+        # _assign_index[v] is the index in the assignment stack at which v is pushed
+        self._assign_value = []
+        self._assign_level = []
+        self._assign_reason = []
+        self._assign_index = []
+        
+        # The assignment stack (trail) that stores the assigned variables in order
+        # of their assignment. It is preallocated with a place for every variable
+        # (once the number of variables is known) and only _trail[0:_trail_head]
+        # is in the stack, so pushing and popping just move _trail_head.
+        self._trail = []
+        self._trail_head = 0
+        
+        # Position in the trail of the next assigned variable whose implications
+        # have to be made by BCP (all the variables before it are propagated)
+        self._prop_head = 0
+        
+        # Arrays used to remove the duplicate literals of a clause.
+        # _seen[l] is the stamp of the last clause in which the literal l
+        # was seen and every clause added gets a new stamp (_stamp is
+        # the last stamp used)
+        self._seen = []
+        self._stamp = 0
+        
+        # _var_seen[v] is the stamp of the last conflict in whose analysis
+        # the variable v was marked (every conflict analyzed also gets
+        # a new stamp)
+        self._var_seen = []
+        
+        # The id of the first learned clause (all the clauses stored from the
+        # input file are before it). _learned_lbd[c-_first_learned_clause] is the
+        # LBD of the learned clause with id c (the number of different levels
+        # of its literals when it was learned)
+        self._first_learned_clause = 0
+        self._learned_lbd = array("i")
+        
+        # The number of learned clauses (counted in the stats object) at which
+        # the learned clause database is reduced the next time and the gap till
+        # the reduction after that (which grows by 300 after every reduction)
+        self._next_reduce = 2000
+        self._reduce_gap = 2300
+        
+        # The id of the clause found false by the last BCP which returned "CONFLICT"
+        # (the conflict always occurs at the current level)
+        self._conflict_clause = -1
         
         # Boolean variable that stores whether the solver should
         # log progress information while solving the problem
         self._is_log = to_log
         
+        # Boolean variable that stores whether the solver should
+        # measure the time spent in each phase. Measuring the time
+        # around every call costs time itself, so it is off by default
+        self._profile = profile
+        
         # The decision heuristic to be used while solving
         # the SAT problem.
         # The decider must be ORDERED, VSIDS or MINISAT (discussed
@@ -369,6 +370,19 @@ class SAT:
             raise ValueError('The decider must be one from the list ["ORDERED","VSIDS","MINISAT"]')
         self._decider = decider
         
+        # The methods that depend on the decider (increasing the scores for
+        # a learned clause and unassigning the variables when backtracking)
+        # are chosen once here instead of checking the decider every time
+        if decider == "VSIDS":
+            self._bump_clause = self._bump_clause_vsids
+            self._unassign_vars = self._unassign_vars_vsids
+        elif decider == "MINISAT":
+            self._bump_clause = self._bump_clause_minisat
+            self._unassign_vars = self._unassign_vars_minisat
+        else:
+            self._bump_clause = self._bump_clause_ordered
+            self._unassign_vars = self._unassign_vars_ordered
+        
         
         if restarter == None:
             # If no restart strategy passed,
@@ -400,16 +414,17 @@ class SAT:
             if restarter == "LUBY":
                 # If the LUBY restart strategy is used
                 
-                # Reset the luby sequencer to initialize it
-                reset_luby()
+                # Index of the luby number used for the
+                # current conflict limit (starts at the first one)
+                self._luby_index = 0
                 
                 # We set base (b) as 512 here
                 self._luby_base = 512
                 
                 # Intialize the conflict limit with
                 # base * the first luby number fetched using the
-                # get_next_luby_number()
-                self._conflict_limit = self._luby_base * get_next_luby_number()
+                # luby method
+                self._conflict_limit = self._luby_base * luby(self._luby_index)
                 
                 # This stores the number of conflicts
                 # before restart and is set to 0
@@ -425,6 +440,7 @@ class SAT:
         # Statistics object used to store the statistics 
         # of the problem being solved
         self.stats = Statistics()
+        self.stats._is_profiled = profile
 
 
 # In[5]:
@@ -433,21 +449,20 @@ class SAT:
 def is_negative_literal(self,literal):
     '''
     Method that takes in number representation of a literal and 
-    returns a boolean indicating if it represents a negative literal.
+    returns whether it represents a negative literal.
     
     Parameters:
         literal: The number representation of the literal
     
     Return:
-        a Boolean which is True if the passed literal is False,
-        else it is False
+        1 (a true value) if the passed literal is negative,
+        else 0 (a false value)
     '''
     
-    # As discussed above, we add _num_vars to the absolute
-    # value to get the representation for the negative literals.
-    # So, we check if its value is greater than _num_vars to see
-    # if it is negative.
-    return literal > self._num_vars
+    # As discussed above, the lowest bit of the representation
+    # is set for the negative literals
+    # (The hot loops use literal & 1 directly instead of calling this method)
+    return literal & 1
 
 # Add the method to the SAT class
 SAT._is_negative_literal = is_negative_literal 
@@ -467,178 +482,176 @@ def get_var_from_literal(self, literal):
         the variable corrsponding to the passed literal
     '''
     
-    # If the literal is negative, then _num_vars was added to 
-    # the variable to get the literal, so variable can 
-    # obtained by subtracting _num_vars from the literal
-    if self._is_negative_literal(literal):
-        return literal - self._num_vars
-    
-    # If the literal is positive, it is same as the variable
-    # and so is returned as it is
-    return literal
+    # The literal is 2*var (positive) or 2*var+1 (negative),
+    # so the variable is obtained by removing the lowest bit
+    # (The hot loops use literal >> 1 directly instead of calling this method)
+    return literal >> 1
 
 # Add the method to the SAT class
 SAT._get_var_from_literal = get_var_from_literal
 
 
+def assign(self,var,value,level,reason):
+    '''
+    Method that assigns the value to the variable var at the passed level
+    and pushes var to the assignment stack.
+    
+    Parameters:
+        var: the variable to be assigned
+        value: the value to be assigned to var (1 for True, 0 for False)
+        level: the level at which var is assigned
+        reason: the id of the clause which implies this assignment (-1 if
+        var is decided or implied by a unary clause)
+    
+    Return:
+        None
+    '''
+    
+    self._assign_value[var] = value
+    self._assign_level[var] = level
+    self._assign_reason[var] = reason
+    
+    # Set the index of var to the position in stack at which it
+    # is pushed
+    self._assign_index[var] = self._trail_head
+    self._trail[self._trail_head] = var
+    self._trail_head += 1
+
+# Add the method to the SAT class
+SAT._assign = assign
+
+
+def assignment_to_string(self,var):
+    '''
+    Method to get the string representation of the assignment of the
+    variable var (used while logging).
+    
+    Parameters:
+        var: the assigned variable
+    
+    Return:
+        a string that has the information about the assignment of var
+    '''
+    
+    return "Var: {} Val: {} Lev: {} Cls: {} Ind: {} ".format(var,self._assign_value[var] == 1,self._assign_level[var],self._assign_reason[var],self._assign_index[var])
+
+# Add the method to the SAT class
+SAT._assignment_to_string = assignment_to_string
+
+
 # In[7]:
 
 
-def add_clause(self,clause):
+def add_clause(self,literals,start,end):
     '''
     Method that takes in a clause, processes it and adds in to the 
     clause database for the problem.
     
     Parameters:
-        clause: the clause (list of literals) to be added
+        literals: list of the number representation of the literals
+        of all the clauses read from the input file
+        start: the position in literals of the first literal of the clause to be added
+        end: the position in literals after the last literal of the clause
+        (the position of the 0 ending the clause)
         
     Return:
-        None
+        the literal of the clause if the clause has only one literal (such a
+        clause is not stored), else -1
     '''
     
-    # Remove the 0 at the end of clause as in the DIMACS CNF format
-    clause = clause[:-1]
-
-    # OrderedDict's fromkeys method makes an 
-    # dictionary from the elements of the list
-    # clause and we again make a list from it
-    # to remove dupicates.
-    # (We could use set here but it does not maintain the order
-    # and adds randomness)
-    clause = list(OrderedDict.fromkeys(clause))
-    
-    # If it is a unary clause, then that unary literal
-    # has to be set True and so we treat it as a special
-    # case
-    if len(clause)==1:
-        # Get the literal
-        lit = clause[0]
-        
-        # Value to be assigned to the variable
-        # Set it to true initially
-        value_to_set = True
-        
-        if lit[0]=='-':
-            # If the literal is negative,
-            # then the value of the variable should be 
-            # set False, to satisfy the literal
-            value_to_set = False
-            var = int(lit[1:])
-        else:
-            # If the literal is positive, value_to_set remains True
-            var = int(lit)
-            
-        
-        if var not in self._variable_to_assignment_nodes:
-            # If the variable has not been assigned yet
-            
-            # Increment the number of implications as it is an implication
-            self.stats._num_implications += 1
-            
-            # Create an AssignmentNode with var, value_to_set, level 0
-            # and clause None as we are not storing this clause
-            node = AssignedNode(var,value_to_set,0,None)
-            
-            # Set the node with var in the dictionary and push it in the
-            # assignment stack
-            self._variable_to_assignment_nodes[var] = node
-            self._assignment_stack.append(node)
-            
-            # Set the index of the node to the position in stack at which it
-            # is pushed
-            node.index = len(self._assignment_stack)-1
-            
-            # Log if _is_log is true
-            if self._is_log:
-                print("Implied(unary): ",node)
-        else:
-            # If the variable is assigned, get its node
-            node = self._variable_to_assignment_nodes[var]
-            
-            # If the set value does not match with the value_to_set,
-            # we have an contradiction and this has happened because of
-            # two conflicting unary clauses in the problem. So, we decide
-            # that the problem is UNSAT.
-            if node.value != value_to_set:
-                # Set the result in stats to UNSAT
-                self.stats._result = "UNSAT"
-                
-                # Return 0 to indicate that the problem has been
-                # solved. Proven UNSAT
-                return 0
-        
-        # Everything normal
-        return 1
-        
-    
-    # This is the list of number representation of the literals
+    # Remove the duplicates by keeping only the first occurrence of
+    # every literal. A literal is a duplicate if it is already stamped
+    # with the stamp of this clause.
+    # (This also maintains the order unlike a set which adds randomness)
+    self._stamp += 1
+    stamp = self._stamp
+    seen = self._seen
     clause_with_literals = []
-    
-    for lit in clause:
-        if lit[0]=='-':
-            # If literal is negative, then add _num_vars to
-            # it to get the literal and push it to the list
-            var = int(lit[1:]) # lit[1:] removes '-' at start
-            clause_with_literals.append(var+self._num_vars)
-            
-            # If VSIDS decider is used, then increase the 
-            # score of the literal appearing in the clause
-            if self._decider == "VSIDS":
-                self._lit_scores[var+self._num_vars] += 1
-            
-            # If MINISAT decider is used, then increase the
-            # score of the variable corresonding to the
-            # literal appearing in the clause
-            if self._decider == "MINISAT":
-                self._var_scores[var] += 1
-        else:
-            # If literal is positive, it is same as its variable 
-            var = int(lit)
-            clause_with_literals.append(var)
-            
-            # If VSIDS decider is used, then increase the 
-            # score of the literal appearing in the clause
-            if self._decider == "VSIDS":
-                self._lit_scores[var] += 1
-                
-            # If MINISAT decider is used, then increase the
-            # score of the variable corresonding to the
-            # literal appearing in the clause
-            if self._decider == "MINISAT":
-                self._var_scores[var] += 1    
+    for pos in range(start,end):
+        lit = literals[pos]
+        if seen[lit] != stamp:
+            seen[lit] = stamp
+            clause_with_literals.append(lit)
+    
+    # If it is a unary clause (after removing the duplicates), then
+    # it is not stored and its literal is returned so that it 
+    # is set True with the other unary clauses
+    if len(clause_with_literals)==1:
+        return clause_with_literals[0]
+    
+    # (The initial scores of the literals appearing in the
+    # clause are counted for all the clauses at once after
+    # the whole file is read)
     
     # Set clause id to the number of clauses
     clause_id = self._num_clauses
     
-    # Append the new clause to the clause list
+    # Append the literals of the new clause to the literal array,
+    # store the offset where the next clause will start
     # and increase the clause counter
-    self._clauses.append(clause_with_literals)
+    self._clause_lits.extend(clause_with_literals)
+    self._clause_off.append(len(self._clause_lits))
     self._num_clauses += 1
     
     # Make the first 2 literals as watch literals for this clause
     # (Maintains the invariant as both are not set and so are not false)
-    watch_literal1 = clause_with_literals[0]
-    watch_literal2 = clause_with_literals[1]
-    
-    # Set the watch literals for the clause to the list containing the 2 watchers
-    self._literals_watching_c[clause_id] = [watch_literal1,watch_literal2]
-    
-    # (In python3, setdefault takes in a key and a value and if in the dictionary, that key has not
-    # been assigned any value, the passed value is set)
-    # Add this clause_id to the watched clauses list of both the watchers
-    self._clauses_watched_by_l.setdefault(watch_literal1,[]).append(clause_id)
-    self._clauses_watched_by_l.setdefault(watch_literal2,[]).append(clause_id)
+    # Push the watch cells 2*clause_id and 2*clause_id+1 to the front of
+    # the watch lists of the first and the second literal
+    self._add_watches(clause_id)
     
     # Everything normal
-    return 1
+    return -1
     
 # Add the method to the SAT class
 SAT._add_clause = add_clause
 
 
+def add_watches(self,clause_id):
+    '''
+    Method that makes the first 2 literals of the clause with id clause_id
+    the watchers of the clause by pushing its watch cells (2*clause_id and
+    2*clause_id+1) to the front of the watch lists of these 2 literals.
+    
+    Parameters:
+        clause_id: the id of the clause (stored in _clause_lits) to be watched
+        
+    Return:
+        None
+    '''
+    
+    # Offset of the first literal of the clause
+    start = self._clause_off[clause_id]
+    clause_lits = self._clause_lits
+    watch_head = self._watch_head
+    watch_next = self._watch_next
+    watch_blocker = self._watch_blocker
+    
+    # Watch cells are created in order, so the cell
+    # 2*clause_id is at the index len(_watch_next)
+    # (The blocker of each cell is the other watcher)
+    for watch_pos in range(0,2):
+        cell = 2*clause_id + watch_pos
+        literal = clause_lits[start+watch_pos]
+        watch_next.append(watch_head[literal])
+        watch_blocker.append(clause_lits[start+1-watch_pos])
+        watch_head[literal] = cell
+
+# Add the method to the SAT class
+SAT._add_watches = add_watches
+
+
 # In[8]:
 
 
+# Regular expression matching a comment line (with its end of line)
+# (The patterns are bytes as the file is read without decoding it)
+_COMMENT_LINE = re.compile(rb"^[ \t]*c.*\n?",re.MULTILINE)
+
+# Regular expression matching the "p" line and having the number
+# of variables and the number of clauses as its two groups
+_PROBLEM_LINE = re.compile(rb"^[ \t]*p[ \t]+cnf[ \t]+(\d+)[ \t]+(\d+)",re.MULTILINE)
+
+
 def read_dimacs_cnf_file(self,cnf_filename):
     '''
     Method that takes in a filename of a file that has a SAT instance
@@ -651,80 +664,182 @@ def read_dimacs_cnf_file(self,cnf_filename):
         None
     '''
     
-    cnf_file = open(cnf_filename,"r")
+    # Read the whole file at once (as bytes, so that it is not
+    # decoded into a string, int parses the bytes tokens directly)
+    cnf_file = open(cnf_filename,"rb")
+    text = cnf_file.read()
+    cnf_file.close()
+    
+    # Remove all the comment lines (the lines starting with 'c')
+    # at once rather than checking every line
+    text = _COMMENT_LINE.sub(b"",text)
+    
+    # Find the "p" line which has the number of variables
+    # and clauses after "cnf"
+    header = _PROBLEM_LINE.search(text)
+    if header == None:
+        raise ValueError('The input file has no "p cnf" line')
+    
+    # Get the number of variables
+    self._num_vars = int(header.group(1))
+    
+    # Create the empty watch lists for all the
+    # 2*_num_vars literals (2 till 2*_num_vars+1)
+    self._watch_head = [-1 for i in range(0,2*self._num_vars+2)]
+    
+    # Create the assignment arrays for all the variables
+    # (no variable is assigned initially)
+    self._assign_value = [-1 for i in range(0,self._num_vars+1)]
+    self._assign_level = [-1 for i in range(0,self._num_vars+1)]
+    self._assign_reason = [-1 for i in range(0,self._num_vars+1)]
+    self._assign_index = [-1 for i in range(0,self._num_vars+1)]
+    
+    # Create the trail with a place for all the variables
+    self._trail = [0 for i in range(0,self._num_vars+1)]
+    
+    # No literal is seen in any clause yet
+    # (and no variable is marked in any conflict)
+    self._seen = [0 for i in range(0,2*self._num_vars+2)]
+    self._var_seen = [0 for i in range(0,self._num_vars+1)]
+    
+    # If MINISAT decider is used, then create a 
+    # _phase array which stores the last assigned
+    # value of the variable (O for false, 1 for true)
+    # (default initialized to 0 and stored as a typed
+    # array of bytes as it has one entry for every variable)
+    if self._decider == "MINISAT":
+        self._phase = array("b",bytes(self._num_vars+1))
     
-    # For all lines in the file
-    for line in cnf_file.readlines():
-        # Remove trailing characters at the end of the line using rstrip
-        line = line.rstrip()
-        
-        # Split the line with space as delimiter
-        line = line.split()
-        
-        # First word of the line
-        first_word = line[0]
+    # If VSIDS decider is used, the _phase array is created
+    # as well, but every entry is initialized to -1 (no value
+    # saved yet) as the value of a variable not assigned before
+    # is given by the literal chosen
+    if self._decider == "VSIDS":
+        self._phase = array("b",[-1])*(self._num_vars+1)
+    
+    # Store the original number of clauses (as given
+    # by the last word of the "p" line) in the stats object
+    self.stats._num_orig_clauses = int(header.group(2))
+    
+    # Everything after the "p" line are the clauses
+    body = text[header.end():]
+    
+    # Parse all the literals of all the clauses in a single pass
+    # (instead of processing them one at a time in every clause) and get
+    # their number representation. The 0s ending the clauses are kept
+    # as they are and are used to split the literals into clauses.
+    literals = [lit<<1 if lit >= 0 else ((-lit)<<1)|1 for lit in map(int,body.split())]
+    
+    # The literals of the unary clauses (they are not stored
+    # and are handled together after all the clauses are read)
+    unary_literals = []
+    
+    # Start of the clause being read
+    start = 0
+    while True:
+        # The clause ends at the next 0 (found by the list's
+        # index method rather than checking every literal)
+        try:
+            end = literals.index(0,start)
+        except ValueError:
+            # No clause is left
+            break
         
-        if first_word == "c":
-            # If it is a comment, ignore it
-            continue
-        elif first_word == "p":
-            # If it is the "p" line
-            
-            # Get the number of variables
-            self._num_vars = int(line[2])
-            
-            # If VSIDS decider is used, then create the
-            # _lit_scores array of size 2*_num_vars (for
-            # all literals) and initialize the score of
-            # all literals by 0
-            if self._decider == "VSIDS":
-                self._lit_scores = [0 for i in range(0,2*self._num_vars+1)]  
-            
-            # If MINISAT decider is used, then create the 
-            # _var_scores array to store scores of all the
-            # variables and initialize it to all zeroes.
-            # Also, a _phase array is created which stores
-            # the last assigned value of the variable
-            # (O for false, 1 for true) (default initialized to 0)
-            if self._decider == "MINISAT":
-                self._var_scores = [0 for i in range(0,self._num_vars+1)]
-                self._phase = [0 for i in range(0,self._num_vars+1)]
-            
-            # Store the original number of clauses (as given
-            # by the last word of this line) in the stats object
-            self.stats._num_orig_clauses = int(line[3])
+        if end == start:
+            # If it is an empty clause (a 0 without any literal),
+            # it can never be satisfied and so the problem is UNSAT
+            # (the remaining clauses are not read)
+            self.stats._result = "UNSAT"
+            break
+        elif end-start == 1:
+            # If it is a unary clause, just keep its literal
+            unary_literals.append(literals[start])
         else:
-            # If it is a clause, then call the _add_clause method
-            ret = self._add_clause(line)  
-            
-            # If 0 is returned, then stop reading
-            # as the problem is proved UNSAT
-            if ret == 0:
-                break
+            # Else call the _add_clause method with the position
+            # of the clause in the literals (the literal is returned
+            # if the clause has only one literal after removing the duplicates)
+            unary_literal = self._add_clause(literals,start,end)
+            if unary_literal != -1:
+                unary_literals.append(unary_literal)
+        start = end+1
+    
+    # The unary literals have to be set True. If a literal and its
+    # complement are both unary clauses, we have an contradiction
+    # and so we decide that the problem is UNSAT.
+    unary_set = set(unary_literals)
+    for lit in unary_set:
+        if lit ^ 1 in unary_set:
+            # Set the result in stats to UNSAT
+            self.stats._result = "UNSAT"
+            break
+    
+    if self.stats._result != "UNSAT":
+        # Set all the unary literals True (in the order in which
+        # they are read, skipping the duplicates) at level 0
+        for lit in unary_literals:
+            var = lit >> 1
+            if self._assign_value[var] == -1:
+                # If the variable has not been assigned yet
+                
+                # Increment the number of implications as it is an implication
+                self.stats._num_implications += 1
+                
+                # Assign var at level 0 with the value satisfying the literal
+                # (False (0) if the literal is negative) and reason -1
+                # as we are not storing this clause
+                self._assign(var,(lit & 1) ^ 1,0,-1)
+                
+                # Log if _is_log is true
+                if self._is_log:
+                    print("Implied(unary): ",self._assignment_to_string(var))
+    
+    # The initial score of a literal is the number of times it appears
+    # in the stored clauses. The occurrences of all the literals are
+    # counted together in a single pass over the literal array.
+    lit_counts = Counter(self._clause_lits)
+    
+    # If VSIDS decider is used, then create the
+    # _lit_scores array of size 2*_num_vars+2 (for
+    # all literals) with the score of every literal
+    # (The scores are stored as a typed array of C doubles
+    # as they are floats once they are increased)
+    if self._decider == "VSIDS":
+        self._lit_scores = array("d",[lit_counts[lit] for lit in range(0,2*self._num_vars+2)])
+    
+    # If MINISAT decider is used, then create the 
+    # _var_scores array to store scores of all the
+    # variables where the score of a variable is the
+    # sum of the scores of its two literals (stored
+    # as a typed array as for VSIDS)
+    if self._decider == "MINISAT":
+        self._var_scores = array("d",[lit_counts[var<<1]+lit_counts[(var<<1)|1] for var in range(0,self._num_vars+1)])
     
     # If the VSIDS decider is used
     if self._decider == "VSIDS":
         # Create a priority queue (max priority queue)
-        # using the initialized scores
-        self._priority_queue = PriorityQueue(self._lit_scores)
+        # using the initialized scores (the priority queue
+        # keeps its own list of the priorities)
+        self._priority_queue = PriorityQueue(self._lit_scores.tolist())
+        
+        # The priority queue has the elements 1 till 2*_num_vars+1,
+        # but 1 (which would be the negative literal of the variable 0)
+        # is not a literal, so remove it
+        self._priority_queue.remove(1)
         
         # _incr is the quantity by which the scores of
         # a literal will be increased when it is 
         # found in a conflict clause
         self._incr = 1
         
-        # Some variables may be already assigned because 
-        # of being in the unary clauses, so remove both 
-        # the literals corresponding to the variable
-        for node in self._assignment_stack:
-            self._priority_queue.remove(node.var)
-            self._priority_queue.remove(node.var+self._num_vars)
+        # (Some variables may be already assigned because of
+        # being in the unary clauses, but they are kept in the
+        # priority queue and skipped when they reach the top)
     
     # If MINISAT decider is used
     if self._decider == "MINISAT":
         # Create a priority queue (max priority queue)
         # using the initialized scores
-        self._priority_queue = PriorityQueue(self._var_scores)
+        self._priority_queue = PriorityQueue(self._var_scores.tolist())
         
         # _incr is the quantity by which the scores of
         # a variable will be increased when it is 
@@ -735,14 +850,10 @@ def read_dimacs_cnf_file(self,cnf_filename):
         # scores will decay after each conflict
         self._decay = 0.85
         
-        # Some variables may be already assigned because 
-        # of being in the unary clauses, so remove them 
-        # from the priority queue
-        for node in self._assignment_stack:
-            self._priority_queue.remove(node.var)
-            
-    # Close the input file
-    cnf_file.close()
+        # (Some variables may be already assigned because of
+        # being in the unary clauses, but they are kept in the
+        # priority queue and skipped when they reach the top)
+
 
 # Add the method to the SAT class
 SAT._read_dimacs_cnf_file = read_dimacs_cnf_file
@@ -764,6 +875,10 @@ def decide(self):
         which is set
     '''
     
+    # Local name for the values of the variables
+    # (read for every variable checked below)
+    assign_value = self._assign_value
+    
     # In these if else statements, we see what decider the solver is using
     # and then find the var and value_to_set
     
@@ -772,16 +887,21 @@ def decide(self):
         # unassigned variable and set it to True
         var = -1
         for x in range(1,self._num_vars+1):
-            if x not in self._variable_to_assignment_nodes:
+            if assign_value[x] == -1:
                 var = x
                 break
 
-        value_to_set = True
+        value_to_set = 1
         
     elif self._decider == "VSIDS":
         # If VSIDS decider is used, we get the literal with the highest
-        # score from the priority queue
-        literal = self._priority_queue.get_top()
+        # score from the priority queue. The literals are not removed from
+        # the queue when they are assigned (lazy deletion), so the assigned
+        # ones are popped and skipped till an unassigned one is found
+        get_top = self._priority_queue.get_top
+        literal = get_top()
+        while literal != -1 and assign_value[literal >> 1] != -1:
+            literal = get_top()
         
         if literal == -1:
             # If it is -1, it means the queue is empty
@@ -790,36 +910,38 @@ def decide(self):
             var = -1
         else:
             # Get the variable associated to the literal
-            var = self._get_var_from_literal(literal)
+            var = literal >> 1
             
             # Store if the literal is negative
-            is_neg_literal = self._is_negative_literal(literal)
+            is_neg_literal = literal & 1
             
             # We need to satisfy the literal so if it is 
-            # negative, set the variable to False (which is
-            # not True) and vice versa
-            value_to_set = not is_neg_literal
+            # negative, set the variable to False (0) and vice versa
+            value_to_set = is_neg_literal ^ 1
             
-            # Remove the lit complementary to
-            # the above literal as we have fixed the
-            # variable and so lit is no longer unassigned
-            if is_neg_literal:
-                self._priority_queue.remove(var)
-            else:
-                self._priority_queue.remove(var+self._num_vars)
+            # If the variable was assigned before, then its last
+            # assigned value (saved in the _phase array when it was
+            # unset) is used instead as in MINISAT (phase-saving)
+            saved_phase = self._phase[var]
+            if saved_phase != -1:
+                value_to_set = saved_phase
+            
+            # (The complementary literal stays in the queue
+            # and is skipped when it reaches the top)
                 
     elif self._decider == "MINISAT":
         # If MINISAT decider is used, we get the variable with the
-        # highest score from the priority queue
-        var = self._priority_queue.get_top()
+        # highest score from the priority queue (skipping the assigned
+        # ones as they are not removed when assigned, as in VSIDS)
+        get_top = self._priority_queue.get_top
+        var = get_top()
+        while var != -1 and assign_value[var] != -1:
+            var = get_top()
         
         # We use its last assigned value (as stored in the 
         # _phase array) to set it
         if var != -1:
-            if self._phase[var] == 0:
-                value_to_set = False
-            else:
-                value_to_set = True
+            value_to_set = self._phase[var]
     
     # If var is still -1, it means all the variables
     # are already assigned and so we return -1
@@ -829,14 +951,9 @@ def decide(self):
     # Increase the level by 1 as a decision is made
     self._level += 1
     
-    # Create a new assignment node with var, value_to_set, level = _level
-    # and clause None as this node is made through decide and not implication.
-    # Add this node to the variable to node dictionary, append it to the stack
-    # and set the index of the new node to the position at which it is pushed
-    new_node = AssignedNode(var,value_to_set,self._level,None)
-    self._variable_to_assignment_nodes[var] = new_node
-    self._assignment_stack.append(new_node)
-    new_node.index = len(self._assignment_stack)-1
+    # Assign var with value_to_set at level = _level and reason -1
+    # as this is made through decide and not implication.
+    self._assign(var,value_to_set,self._level,-1)
     
     # Increase the number of decisions made in the stats object.
     self.stats._num_decisions += 1
@@ -844,7 +961,7 @@ def decide(self):
     # Log if _is_log is true
     if self._is_log:
         print("Choosen decision: ",end="")
-        print(new_node)
+        print(self._assignment_to_string(var))
     
     # return the var which is set
     return var
@@ -856,15 +973,15 @@ SAT._decide = decide
 # In[10]:
 
 
-def boolean_constraint_propogation(self,is_first_time):
+def boolean_constraint_propogation(self):
     '''
     Main method that makes all the implications. 
     
-    There are two main cases. When it is run for the first time (if is_first_time is True), we can have many 
-    decisions already made due to the implications by unary clauses and so we have to traverse through all and 
-    make further implications. So, we start at the 0th index in the assignment list. If is_first_time is False, 
-    it means that we only have to take the last made decision into account and make the implications and so we 
-    start from the last node in the assignment stack.
+    It starts at the propagation head (_prop_head) in the assignment stack and makes the implications of
+    every assigned variable from there. When it is run for the first time, the head is at the 0th index, so
+    the implications of all the assignments due to the unary clauses are made. After that, the head is at
+    the last made decision (or the literal implied after backtracking) and so only that and the further
+    implications are taken into account.
     
     The implied decisions are pushed into the stack until no more implications can be made and "NO_CONFLICT"
     is returned, or a conflict is detected and in that case "CONFLICT" is returned. If the number of conflicts 
@@ -872,8 +989,7 @@ def boolean_constraint_propogation(self,is_first_time):
     solver.
     
     Parameters:
-        is_first_time: Boolean which is set to True when this method is run initially and False for all
-        other invocations
+        None
     
     Return:
         "CONFLICT" or "NO_CONFLICT" depending on whether a conflict arised while making the
@@ -881,107 +997,144 @@ def boolean_constraint_propogation(self,is_first_time):
         and the restart strategy used by the solver (if any)
     '''
     
-    # Point to the last decision
-    last_assignment_pointer = len(self._assignment_stack)-1
-    
-    # If first time, then point to 0
-    if is_first_time:
-        last_assignment_pointer = 0
-        
-    # Traverse through all the assigned nodes in the stack 
+    # Whether to log (read once, as it does not change
+    # while the implications are made)
+    is_log = self._is_log
+    
+    # Bind the arrays and the attributes used in the loops below
+    # to local names (a local name is faster to read than an attribute).
+    # The arrays are only changed in place here, and the trail head and
+    # the propagation head are stored back before returning.
+    assign_value = self._assign_value
+    assign_level = self._assign_level
+    assign_reason = self._assign_reason
+    assign_index = self._assign_index
+    trail = self._trail
+    trail_head = self._trail_head
+    watch_head = self._watch_head
+    watch_next = self._watch_next
+    watch_blocker = self._watch_blocker
+    clause_off = self._clause_off
+    clause_lits = self._clause_lits
+    level = self._level
+    restarter = self._restarter
+    
+    # Point to the first assigned variable not propagated yet
+    last_assignment_pointer = self._prop_head
+        
+    # Traverse through all the assigned variables in the stack 
     # and make implications
-    while last_assignment_pointer < len(self._assignment_stack):
-        # Get the assigned node
-        last_assigned_node = self._assignment_stack[last_assignment_pointer]
+    while last_assignment_pointer < trail_head:
+        # Get the assigned variable
+        last_assigned_var = trail[last_assignment_pointer]
         
         # If the variable's value was set to True, then negative literal corresponding to
         # the variable is falsed, else if it set False, the positive literal
         # is falsed
-        if last_assigned_node.value == True:
-            literal_that_is_falsed = last_assigned_node.var + self._num_vars
-        else:
-            literal_that_is_falsed = last_assigned_node.var
+        # (The lowest bit of the falsed literal is set if it is negative, so it
+        # is the same as the value (1 for True and 0 for False))
+        literal_that_is_falsed = (last_assigned_var << 1) | assign_value[last_assigned_var]
         
         # Now we change the watch literals for all clauses watched by literal_that_is_falsed
         
-        itr = 0
-        
-        # Get the list of clauses watched by the falsed literal
-        clauses_watched_by_falsed_literal = self._clauses_watched_by_l.setdefault(literal_that_is_falsed,[]).copy()
-        
-        # We iterate the list of clauses in reverse order as the conflict clauses
-        # are to the end and we feel using them first is beneficial
-        clauses_watched_by_falsed_literal.reverse()
+        # Walk the watch list of the falsed literal in place. prev_cell is the
+        # cell before cell in the list (-1 if cell is the first one) and is
+        # needed to unlink cell when the clause gets a new watcher.
+        # (The newest clauses are at the front of the list, so the conflict
+        # clauses are visited first which we feel is beneficial)
+        prev_cell = -1
+        cell = watch_head[literal_that_is_falsed]
         
         # Traverse through them and find a new watch literal and if we are unable to
         # find a new watch literal, we have an implication (because of the other watch literal)
         # If other watch literal is set to a value opposite of what is implied, we have a 
         # conflict
-        while itr < len(clauses_watched_by_falsed_literal):
-            # Get the clause and its watch list
-            clause_id = clauses_watched_by_falsed_literal[itr]
-            watch_list_of_clause = self._literals_watching_c[clause_id]
+        while cell != -1:
+            next_cell = watch_next[cell]
+            
+            # If the blocker of the cell is true, the clause is
+            # satisfied, so move to the next cell without reading the clause
+            blocker = watch_blocker[cell]
+            if assign_value[blocker >> 1] == (blocker & 1) ^ 1:
+                prev_cell = cell
+                cell = next_cell
+                continue
+            
+            # Get the clause, its literals (from start till end in _clause_lits)
+            # and the position (0 or 1) of the falsed literal in the clause
+            clause_id = cell >> 1
+            watch_pos = cell & 1
+            start = clause_off[clause_id]
+            end = clause_off[clause_id+1]
             
             # Get the other watch literal for this clause
             # (other than the falsed one)
-            other_watch_literal = watch_list_of_clause[0]
-            if other_watch_literal == literal_that_is_falsed:
-                other_watch_literal = watch_list_of_clause[1]
+            other_watch_literal = clause_lits[start+1-watch_pos]
             
             # Get the variable corresponding to the  watch literal
             # and see if the other watch literal is negative
-            other_watch_var = self._get_var_from_literal(other_watch_literal)
-            is_negative_other = self._is_negative_literal(other_watch_literal)
+            other_watch_var = other_watch_literal >> 1
+            is_negative_other = other_watch_literal & 1
             
             # If other watch literal is set and is set so as to be true,
             # move to the next clause as this clause is already satisfied
-            if other_watch_var in self._variable_to_assignment_nodes:
-                value_assgned = self._variable_to_assignment_nodes[other_watch_var].value
-                if (is_negative_other and value_assgned == False) or (not is_negative_other and value_assgned == True):
-                    itr += 1
-                    continue
+            # (A literal is true if the value of its variable is 0 (False) and
+            # it is negative or if the value is 1 (True) and it is positive)
+            # (The other watch literal is made the blocker so that the
+            # clause is skipped directly the next time)
+            other_watch_value = assign_value[other_watch_var]
+            if other_watch_value == is_negative_other ^ 1:
+                watch_blocker[cell] = other_watch_literal
+                prev_cell = cell
+                cell = next_cell
+                continue
             
             # We need to find a new literal to watch
-            new_literal_to_watch = -1
-            clause = self._clauses[clause_id]
+            new_watch_pos = -1
             
-            # Traverse through all literals
-            for lit in clause:
-                if lit not in watch_list_of_clause:
-                    # Consider literals that are not watchers now
-                    var_of_lit = self._get_var_from_literal(lit)
-                    
-                    if var_of_lit not in self._variable_to_assignment_nodes:
-                        # If the literal is not set, it can be used as a watcher as it is
-                        # not False
-                        new_literal_to_watch = lit
-                        break
-                    else:
-                        # If the literal's variable is set in such a way that the literal is
-                        # true, we use it as new watcher as anyways the clause is satisfied
-                        node = self._variable_to_assignment_nodes[var_of_lit]
-                        is_negative = self._is_negative_literal(lit)
-                        if (is_negative and node.value == False) or (not is_negative and node.value == True):
-                            new_literal_to_watch = lit
-                            break
+            # Traverse through all literals that are not watchers now
+            for pos in range(start+2,end):
+                lit = clause_lits[pos]
+                
+                # If the literal is not set (value -1), it can be used as a watcher as it is
+                # not False. If the literal's variable is set in such a way that the literal is
+                # true, we use it as new watcher as anyways the clause is satisfied.
+                # The literal is False only if the value of its variable is
+                # same as its lowest bit (1 (True) for negative and 0 (False) for positive)
+                if assign_value[lit >> 1] != lit & 1:
+                    new_watch_pos = pos
+                    break
             
             
-            if new_literal_to_watch != -1:
-                # If new_literal_to_watch is not -1, then it means that we have a new literal to watch the
+            if new_watch_pos != -1:
+                # If new_watch_pos is not -1, then it means that we have a new literal to watch the
                 # clause
+                new_literal_to_watch = clause_lits[new_watch_pos]
+                
+                # Swap the falsed literal and the new literal so that the
+                # new literal is at the watch position
+                clause_lits[start+watch_pos] = new_literal_to_watch
+                clause_lits[new_watch_pos] = literal_that_is_falsed
                 
-                # Remove the falsed literal and add the new literal to watcher list
-                # of the clause
-                self._literals_watching_c[clause_id].remove(literal_that_is_falsed)
-                self._literals_watching_c[clause_id].append(new_literal_to_watch)
+                # Unlink the cell from the watch list of the falsed literal
+                # and push it to the front of the watch list of the new literal
+                if prev_cell == -1:
+                    watch_head[literal_that_is_falsed] = next_cell
+                else:
+                    watch_next[prev_cell] = next_cell
+                watch_next[cell] = watch_head[new_literal_to_watch]
+                watch_head[new_literal_to_watch] = cell
+                
+                # The other watcher is the blocker for the new watch
+                watch_blocker[cell] = other_watch_literal
                 
-                # Remove clause from the watched clauses list of the falsed literal
-                # and add it to the watched clauses list of the new literal
-                self._clauses_watched_by_l.setdefault(literal_that_is_falsed,[]).remove(clause_id)
-                self._clauses_watched_by_l.setdefault(new_literal_to_watch,[]).append(clause_id)
+                # Move to the next cell (prev_cell remains the same
+                # as cell is no longer in this list)
+                cell = next_cell
+                continue
                 
             else:
-                if other_watch_var not in self._variable_to_assignment_nodes:
+                if other_watch_value == -1:
                     # We get no other watcher that means all the literals other than
                     # the other_watch_literal are false and the other_watch_literal
                     # has to be made true for this clause to be true. This is possible
@@ -989,63 +1142,46 @@ def boolean_constraint_propogation(self,is_first_time):
                     # is not set.
                     
                     # Get the value to set the variable as not of if the other watch literal
-                    # is negative. If it is negative (is_negative_other is True), then its variable 
-                    # should be set False (not True) and vice_versa
-                    value_to_set = not is_negative_other
-                    
-                    # Create the AssignedNode with the variable, value_to_set, level and
-                    # clause_id to refer the clause which is responsible to imply this.
-                    # Then, store it in the variable to assignment dictionary with key
-                    # other_watch_var.
-                    assign_var_node = AssignedNode(other_watch_var,value_to_set,self._level,clause_id)
-                    self._variable_to_assignment_nodes[other_watch_var] = assign_var_node
+                    # is negative. If it is negative (is_negative_other is 1), then its variable 
+                    # should be set False (0) and vice_versa
+                    value_to_set = is_negative_other ^ 1
                     
-                    # Push the created node in the assignment stack and set its 
+                    # Assign other_watch_var with value_to_set at the current level,
+                    # and clause_id as the reason to refer the clause which is responsible
+                    # to imply this. Then, push it in the assignment stack and set its 
                     # index to the position at which it is pushed.
-                    self._assignment_stack.append(assign_var_node)
-                    assign_var_node.index = len(self._assignment_stack)-1
+                    assign_value[other_watch_var] = value_to_set
+                    assign_level[other_watch_var] = level
+                    assign_reason[other_watch_var] = clause_id
+                    assign_index[other_watch_var] = trail_head
+                    trail[trail_head] = other_watch_var
+                    trail_head += 1
                     
-                    # If the VSIDS decider is used, then remove the
-                    # two literals corresponding to the variable implied
-                    # above as we maintain only the unassigned variables in
-                    # the priority queue
-                    if self._decider == "VSIDS":
-                        self._priority_queue.remove(other_watch_var)
-                        self._priority_queue.remove(other_watch_var+self._num_vars)
+                    # (The implied variable (or its literals for VSIDS) is not
+                    # removed from the priority queue, decide skips the assigned
+                    # ones when they reach the top. The phase of the variable
+                    # for MINISAT is saved when it is unset in backtrack, so
+                    # nothing here depends on the decider)
                     
-                    # If MINISAT decider is used
-                    if self._decider == "MINISAT":
-                        # Remove the variable which is now set from 
-                        # the priority queue as we only maintain
-                        # the unassigned varibles in the priority
-                        # queue
-                        self._priority_queue.remove(other_watch_var)
-                        
-                        # Use the value_to_set to set the phase 
-                        # of the variable
-                        if value_to_set == False:
-                            self._phase[other_watch_var] = 0
-                        else:
-                            self._phase[other_watch_var] = 1
-                        
                     # Increment the number of implications in the stats 
                     # object by 1
                     self.stats._num_implications += 1
                     
                     # Log if _is_log is True
-                    if self._is_log:
+                    if is_log:
                         print("Implied decision:", end="")
-                        print(assign_var_node)
+                        print(self._assignment_to_string(other_watch_var))
                 else:
                     
-                    if self._restarter == "GEOMETRIC":
-                        # If the GEOMETRIC restart strategy is used
+                    if restarter is not None:
+                        # If a restart strategy is used (GEOMETRIC or LUBY),
+                        # the conflicts are counted in the same way and only
+                        # the new limit depends on the strategy
                         
                         # Increase the conflicts_before_restart by 1
                         # as we have encountered a conflict
                         self._conflicts_before_restart += 1
                         
-                        
                         if self._conflicts_before_restart >= self._conflict_limit:
                             # If the number of conflicts reach (or cross) the limit
                             # we RESTERT
@@ -1058,81 +1194,61 @@ def boolean_constraint_propogation(self,is_first_time):
                             # new conflicts after the restart
                             self._conflicts_before_restart = 0
                             
-                            # As in GEOMETRIC restart strategy,
-                            # multiply the conflict limit by the
-                            # pre defined limit multiplier
-                            self._conflict_limit *= self._limit_mult
+                            if restarter == "GEOMETRIC":
+                                # As in GEOMETRIC restart strategy,
+                                # multiply the conflict limit by the
+                                # pre defined limit multiplier
+                                self._conflict_limit *= self._limit_mult
+                            else:
+                                # As in LUBY restart strategy,
+                                # multiply the base by the next 
+                                # luby number
+                                self._luby_index += 1
+                                self._conflict_limit = self._luby_base * luby(self._luby_index)
                             
                             # Log if _is_log is true
-                            if self._is_log:
-                                print("RESTARTING with GEOMETRIC RESTART LIMIT {}".format(self._conflict_limit))
+                            if is_log:
+                                print("RESTARTING with {} RESTART LIMIT {}".format(restarter,self._conflict_limit))
                             
-                            # return "RESTART" indicating that the solver needs to restart
-                            return "RESTART"
-                        
-                    if self._restarter == "LUBY":
-                        # If the LUBY restart strategy is used
-
-
-                        # Increase the conflicts_before_restart by 1
-                        # as we have encountered a conflict
-                        self._conflicts_before_restart += 1
-
-                        if self._conflicts_before_restart >= self._conflict_limit:
-                            # If the number of conflicts reach (or cross) the limit
-                            # we RESTERT
-
-                            # Increment the restart counter in the stats object
-                            self.stats._restarts += 1
-
-
-                            # Set the conflicts before restart to 0 
-                            # as now it will be used to count the 
-                            # new conflicts after the restart
-                            self._conflicts_before_restart = 0
-
-                            # As in LUBY restart strategy,
-                            # multiply the base by the next 
-                            # luby number
-                            self._conflict_limit = self._luby_base * get_next_luby_number()
-
-                            # Log if _is_log is true
-                            if self._is_log:
-                                print("RESTARTING with LUBY RESTART LIMIT {}".format(self._conflict_limit))
-
-                            # return "RESTART" indicating that the solver needs to restart
+                            # Store the heads back and return "RESTART"
+                            # indicating that the solver needs to restart
+                            self._trail_head = trail_head
+                            self._prop_head = last_assignment_pointer
                             return "RESTART"
                         
                     # Conflict is detected as the other_watch_literal is not unassigned (as it is in this
                     # else case) and it is not true (as if it was true as we checked this earlier)
                     
-                    # Create a conflict node and push it to assignment stack. (Var and Value are set None
-                    # and the level and clause is set to the current level and the present clause that 
-                    # caused the conflict). Conflict node is needed to store which clause caused the conflict 
-                    # and the level at which the conflict occured
-                    conflict_node = AssignedNode(None,None,self._level,clause_id)
-                    self._assignment_stack.append(conflict_node)
+                    # Store the present clause that caused the conflict as it is needed
+                    # to analyze the conflict (the conflict occured at the current level)
+                    self._conflict_clause = clause_id
                     
-                    # Set its index to the position at which it is pushed
-                    conflict_node.index = len(self._assignment_stack)-1
+                    # Store the heads back (backtrack moves the propagation
+                    # head back to the new trail head)
+                    self._trail_head = trail_head
+                    self._prop_head = last_assignment_pointer
                     
                     # Log if _is_log is True
-                    if self._is_log:
+                    if is_log:
                         print("CONFLICT")
                     
                     # Return "CONFLICT" as a conflict is encountered
                     return "CONFLICT"
             
-            # Increment itr to get the next clause
-            itr += 1
+            # Move to the next cell in the watch list
+            prev_cell = cell
+            cell = next_cell
         
-        # Increment last_assignment_pointer to get the next assigned node
+        # Increment last_assignment_pointer to get the next assigned variable
         # to be used to make the implications
         last_assignment_pointer += 1
     
     # If the loop finishes successfully, it means all the 
     # implications have been made without any conflict
-    # and "NO_CONFLICT" is returned
+    # and "NO_CONFLICT" is returned (after storing the
+    # heads back)
+    self._trail_head = trail_head
+    self._prop_head = last_assignment_pointer
     return "NO_CONFLICT"
 
 # Add the method to the SAT class
@@ -1167,6 +1283,12 @@ SAT._boolean_constraint_propogation = boolean_constraint_propogation
 #    2-4 are repeated until the final conflict clause (with only one literal set at the conflict level L which also corresponds to the first UIP) is obtained.
 # 
 # This clause is then added to the clause database and the SAT solver jumps to the level $L_{Backjump}$ as described in the previous section.
+# 
+# The intermediate clauses are not built. The variables of every clause used are marked instead (so a variable is never added twice and the resolved variable is left out). The literals set below L go directly into the final clause, and the literals set at L are only counted. The next variable V is the latest marked variable on the assignment stack, so it is found with one walk back from the top of the stack. Each resolution reduces the count by 1, and the clause is final when the count is 1. The variable left is the first UIP. Literals set at level 0 are left out too, as they are false forever.
+# 
+# ## Minimizing the Conflict Clause
+# 
+# The conflict clause can have literals that are implied by its other literals. If the variable of a literal l below L is implied by a clause whose other literals are all in the conflict clause (or are set at level 0), then l is false whenever they are false, and so l can be removed from the conflict clause. This is checked recursively as well: the literals of the implying clause that are not in the conflict clause can themselves be redundant this way. This is the clause minimization used by MiniSAT. A decided variable is never redundant, and the check stops early on reaching a level that has no literal in the conflict clause (as such a literal can not be implied by the clause). The shorter clauses are cheaper to watch and visit in BCP and imply more.
 # <hr style="border:2px solid gray"> </hr>
 # 
 # The methods implemented below are the ones related to analyzing the conflicts and backtracking.
@@ -1174,234 +1296,141 @@ SAT._boolean_constraint_propogation = boolean_constraint_propogation
 # In[11]:
 
 
-def binary_resolute(self,clause1,clause2,var):
-    '''
-    Method that takes in two clauses, clause1 and clause2 and performs
-    their binary resolution (as described above) with respect to the passed
-    variable.
-    
-    Parameters:
-        clause1: the first clause(list of literals)
-        clause2: the second clause(list of literals)
-        var: the variable with respect to which the binary resolution should be performed
-    
-    Return:
-        the binary resolution of the passed clauses (Clause 1 and Clause 2) with respect to
-        the passed variable (var)
-    '''
-    
-    # Add the clause 2 list of literals ahead of clause 1
-    full_clause = clause1 + clause2
-    
-    # We made sure that the clauses have no duplicates but
-    # after merging two clauses, we can have duplicates so we
-    # remove them
-    full_clause = list(OrderedDict.fromkeys(full_clause))
-    
-    # As in the defination of binary resolution, we
-    # remove the positive literal (var) and the negative
-    # literal (var+self._num_vars) from the combined list to
-    # get the final resolution clause
-    full_clause.remove(var)
-    full_clause.remove(var+self._num_vars)
-    
-    # return the final clause
-    return full_clause 
-
-# Add the method to the SAT class
-SAT._binary_resolute = binary_resolute
-
-
-# In[12]:
-
-
-def is_valid_clause(self,clause,level):
-    '''
-    Method that checks if the passed clause is a valid conflict clause (
-    with only one literal set at level). This method while traversing the clause
-    also finds the latest assigned literal set at level
-    
-    Parameters:
-        clause: the clause that has to be checked
-        level: the level at which the conflict occurs
-    
-    Return:
-        a boolean which is True if the passed clause is a valid conflict clause
-        the latest assigned literal set at level
-    '''
-    
-    # To count the literals set at level
-    counter = 0
-    
-    # Store the maximum index of the literals encountered
-    maxi = -1
-    
-    # Candidate literal that is assigned the latest at level
-    cand = -1
-    
-    for lit in clause:
-        # For all literals in the clause,
-        # get the assignment node corresponding
-        # the variable of the literal
-        var = self._get_var_from_literal(lit)
-        node = self._variable_to_assignment_nodes[var]
-        
-
-        if node.level == level:
-            # If the level at which the node is assigned
-            # is same as the passed level
-            
-            # Increase the counter of literals assigned
-            # at passed level by 1
-            counter += 1
-            
-            # We need to find the latest assigned node at this 
-            # level. latest assigned means the greatest index
-            # value.
-            if node.index > maxi:
-                # If the node's index value is greater than maxi,
-                # set maxi to the node's index and set the candidate
-                # as the node
-                maxi = node.index
-                cand = node
-                
-    # Conflict is valid if counter == 1, so return counter == 1
-    # and the candidate node (latest assigned node at the passed level)
-    return counter == 1,cand
-
-# Add the method to the SAT class
-SAT._is_valid_clause = is_valid_clause
-
-
-# In[13]:
-
-
-def get_backtrack_level(self,conflict_clause,conflict_level):
-    '''
-    Method to get the backtrack level (level to which the solver should jump)
-    using the passed conflict clause and the conflict level. The method also
-    returns the only literal assigned at the conflict level present in the 
-    conflict clause.
-    
-    Parameters:
-        conflict_clause: the passed conflict clause
-        conflict_level: the passed conflict level
-        
-    Return:
-        the level to which the solver should backtrack and
-        the only literal assigned at the conflict_level in the conflict_clause
-    '''
-    
-    # Stores the backtrack level
-    maximum_level_before_conflict_level = -1
-    
-    # Stores the only literal in the conflict
-    # clause which is assigned at the conflict level
-    literal_at_conflict_level = -1
-    
-    
-    for lit in conflict_clause:
-        # For all literals in the clause,
-        # get the assignment node corresponding
-        # the variable of the literal
-        var = self._get_var_from_literal(lit)
-        assigned_node = self._variable_to_assignment_nodes[var]
-        
-        
-        if assigned_node.level == conflict_level:
-            # If the node's level is the conflict_level,
-            # set this lit to literal_At_conflict_level
-            literal_at_conflict_level = lit
-        else:
-            # Else, we need to find the maximum of all the levels
-            # other than the conflict level. If this node's level 
-            # is greater than the maximum seen till now, the maximum 
-            # is set to this node's level
-            if assigned_node.level > maximum_level_before_conflict_level:
-                maximum_level_before_conflict_level = assigned_node.level
-    
-    # Return the backtrack level and the literal at conflict level
-    return maximum_level_before_conflict_level, literal_at_conflict_level
-
-# Add the method to the SAT class
-SAT._get_backtrack_level = get_backtrack_level
-
-
-# In[14]:
-
-
 def analyze_conflict(self):
     '''
-    Method that is called when a conflict occurs during the 
+    Method that is called when a conflict occurs during the
     Boolean Constrain Propogation (BCP). It analyzes the conflict,
     generates the valid conflict clause (as discussed above) and adds
     it to the clause database. It then returns the backtrack level
-    and the assignment node implied by the conflict clause that will be used 
-    for implications once the solver backtracks (described below in the algorithm).
+    and the literal implied by the conflict clause (with the clause implying it) that will
+    be used for implications once the solver backtracks (described below in the algorithm).
     
     Parameters:
         None
-        
+    
     Return:
-        the level to which the solver should jump back and
-        the assignement node implied by the conflict clause    
+        the level to which the solver should jump back,
+        the literal implied by the conflict clause and
+        the id of the clause implying the literal (-1 if it is not stored)
     '''
     
     
-    # As this method is called, it means there was a conflict and
-    # the last node in the assignment stack is a conflict node
-    assigment_stack_pointer = len(self._assignment_stack)-1
+    # Whether to log (read once, as it does not change
+    # while the conflict is analyzed)
+    is_log = self._is_log
     
-    # The conflict node is used to get the conflict level and the
-    # clause that caused the conflict
-    conflict_node = self._assignment_stack[assigment_stack_pointer]
-    conflict_level = conflict_node.level
-    conflict_clause = self._clauses[conflict_node.clause]
-    
-    # As we are analyzing the conflict, we can remove it 
-    # from the assignment stack
-    self._assignment_stack.pop()
-    
-   # Log the conflict node if _is_log is True
-    if self._is_log:
-        print("Analyzing Conflict in the node: ",end="")
-        print(conflict_node)
+    # As this method is called, it means there was a conflict
+    # at the current level because of the clause _conflict_clause
+    conflict_level = self._level
+    clause_id = self._conflict_clause
+   
+   # Log the conflict if _is_log is True
+    if is_log:
+        print("Analyzing Conflict in the clause: ",end="")
+        print(clause_id)
     
     # If the conflict is at level 0, then the problem is
     # UNSAT as till now, no decisions have been made and
     # we have reached a conflict. So we return -1 as the backtrack level
-    # and None as the new implied node to represent UNSAT
+    # and -1 as the new implied literal to represent UNSAT
     if conflict_level == 0:
-        return -1,None
+        return -1,-1,-1
+    
+    # Local names for the arrays used in every step of the loop below
+    clause_lits = self._clause_lits
+    clause_off = self._clause_off
+    assign_value = self._assign_value
+    assign_level = self._assign_level
+    assign_reason = self._assign_reason
+    trail = self._trail
+    
+    # The variables of the clauses resolved are marked with a
+    # new stamp in _var_seen (so no array has to be cleared)
+    self._stamp += 1
+    stamp = self._stamp
+    var_seen = self._var_seen
+    
+    # The conflict clause being learned. It has the literals set at the
+    # levels below the conflict level (the literals set at level 0 are
+    # left out as they are false forever) and its first position is kept
+    # for the literal of the first UIP which is known at the end
+    conflict_clause = [-1]
+    
+    # Number of the marked variables set at the conflict level which are
+    # not resolved yet (the conflict clause is valid when it is 1)
+    counter = 0
+    
+    # Position in the trail from which the latest assigned
+    # marked variable is searched
+    index = self._trail_head-1
     
     # The loop responsible for finding the conflict clause
     while True:
-        # is_nice tells whether the conflict clause has only one literal set
-        # at the conflict level and prev_assigned_node is the latest assigned literal
-        # on the conflict level present in the conflict clause
-        is_nice,prev_assigned_node = self._is_valid_clause(conflict_clause,conflict_level)
-        
-        # If the clause is nice, i.e., it is the
-        # final conflict clause, then break
-        if is_nice:
+        # Mark the variables of the clause (the conflict clause first and
+        # then the clause implying the latest assigned variable). A marked
+        # variable is skipped, so the resolved variable and the duplicates
+        # are left out as in the binary resolution.
+        for pos in range(clause_off[clause_id],clause_off[clause_id+1]):
+            lit = clause_lits[pos]
+            var = lit >> 1
+            if var_seen[var] != stamp:
+                var_seen[var] = stamp
+                level = assign_level[var]
+                if level == conflict_level:
+                    # The variables set at the conflict level are counted
+                    # (they are resolved later or are the first UIP)
+                    counter += 1
+                elif level > 0:
+                    # The other literals are in the final conflict clause
+                    conflict_clause.append(lit)
+        
+        # Find the latest assigned marked variable by going back in the
+        # trail (all of them are set at the conflict level as the trail
+        # has the variables in the order of their levels)
+        while var_seen[trail[index]] != stamp:
+            index -= 1
+        var = trail[index]
+        index -= 1
+        
+        # If it is the only marked variable of the conflict level left,
+        # it is the first UIP, and the clause is the final conflict clause
+        counter -= 1
+        if counter == 0:
             break
         
         # Log if _is_log is true
-        if self._is_log:
-            print("Clause: ",conflict_clause)
-            print("Node_to_use ",prev_assigned_node)
-            
+        if is_log:
+            print("Node_to_use ",self._assignment_to_string(var))
+        
         # If the conflict clause is not the final clause, then
         # as decribed above, replace it with its binary resolution
         # with the clause corresponding to the latest assigned literal
-        clause = self._clauses[prev_assigned_node.clause]
-        var = prev_assigned_node.var
-        conflict_clause = self._binary_resolute(conflict_clause,clause,var)
+        clause_id = assign_reason[var]
+    
+    # The literal of the first UIP is the falsed literal of its
+    # variable (its lowest bit is set if the variable is True)
+    conflict_clause[0] = (var << 1) | assign_value[var]
+    
+    # Minimize the conflict clause (as discussed above) by removing the
+    # literals implied by the other literals of the clause. A literal is
+    # checked only if its variable is implied, and the levels of the clause
+    # are summarized in abstract_levels (one bit for every level) so that
+    # the check stops at once on reaching a level that is not in the clause
+    if len(conflict_clause) > 1:
+        abstract_levels = 0
+        for pos in range(1,len(conflict_clause)):
+            abstract_levels |= 1 << (assign_level[conflict_clause[pos] >> 1] & 31)
+        minimized_clause = [conflict_clause[0]]
+        for pos in range(1,len(conflict_clause)):
+            lit = conflict_clause[pos]
+            if assign_reason[lit >> 1] == -1 or not self._lit_redundant(lit,abstract_levels):
+                minimized_clause.append(lit)
+        conflict_clause = minimized_clause
     
     # Log if _is_log is true
-    if self._is_log:
+    if is_log:
         print("Conflict Clause: ",conflict_clause)
-            
+    
     if len(conflict_clause) > 1:
         # If the length of the learned conflict clause is more than 1
         
@@ -1411,129 +1440,240 @@ def analyze_conflict(self):
         # Get the clause_id for this clause
         clause_id = self._num_clauses
         
-        # Increment the number of clauses and add
-        # the new clause to the clauses database
-        self._num_clauses += 1
-        self._clauses.append(conflict_clause)
-        
-        # Set the first 2 literals of the clause as its watchers.
-        # Add the clause_id to the watch list of the first two literals of the clause
-        self._clauses_watched_by_l.setdefault(conflict_clause[0],[]).append(clause_id)
-        self._clauses_watched_by_l.setdefault(conflict_clause[1],[]).append(clause_id)
-        
-        # Set the list containing the 2 watchers as the literals watching the clause
-        self._literals_watching_c[clause_id] = [conflict_clause[0],conflict_clause[1]]
-        
-        # If VSIDS decider is used
-        if self._decider == "VSIDS":
-            # For all the literals appearing in the conflict clause,
-            # their score is increased by _incr
-            for l in conflict_clause:
-                self._lit_scores[l] += self._incr
-                self._priority_queue.increase_update(l,self._incr)
-                
-            # Increase _incr by 0.75 to give more weightage
-            # to the recent conflict clausing literal
-            self._incr += 0.75
-        
-        # If MINISAT decider is used
-        if self._decider == "MINISAT":
-            # For all variables corresponding to the 
-            # literals appearing in the clause, the
-            # scores are increased by _incr
-            for l in conflict_clause:
-                var = self._get_var_from_literal(l)
-                self._var_scores[var] += self._incr
-                self._priority_queue.increase_update(var,self._incr)
-            
-            # To simulate the decay of all the previous var scores efficiently
-            # (so as to give more weightage to the recent conflict clausing variables),
-            # we divide the _incr by decay (instead of multiplying it to all the scores)
-            self._incr /= self._decay
-        
-        # backtrack_level is the level to which the solver should jump back
-        # conflict_level_literal is the single literal of the conflict level present in 
-        # the conflict clause
-        backtrack_level, conflict_level_literal = self._get_backtrack_level(conflict_clause,conflict_level)
+        # The backtrack level is the maximum level below the conflict level
+        # in the conflict clause (all the levels after the first UIP are below
+        # it) and backtrack_pos is the position of a literal set at it
+        backtrack_level = 0
+        backtrack_pos = -1
+        for pos in range(1,len(conflict_clause)):
+            level = assign_level[conflict_clause[pos] >> 1]
+            if level > backtrack_level:
+                backtrack_level = level
+                backtrack_pos = pos
         
-        # Get the variable related to the conflict_level_literal
-        conflict_level_var = self._get_var_from_literal(conflict_level_literal)
+        # Store the LBD of the clause (the number of different levels of its
+        # literals) which is used to choose the learned clauses to be removed
+        self._learned_lbd.append(len({assign_level[lit >> 1] for lit in conflict_clause}))
+
+        # Increase the scores of the literals (or the variables) of the
+        # conflict clause as the decider used does
+        self._bump_clause(conflict_clause)
         
-        # Check if conflict_level_literal is negative
-        is_negative_conflict_lit = self._is_negative_literal(conflict_level_literal)
+        # conflict_level_literal is the single literal of the conflict level present in 
+        # the conflict clause (the first UIP) and backtrack_level (found above) is the
+        # level to which the solver should jump back
+        conflict_level_literal = conflict_clause[0]
+        
+        # The watchers of the clause are set as the conflict_level_literal (which will
+        # be implied after backtracking) and a literal set at the backtrack_level (which
+        # is the last one to be unset among the others). So, the invariant is maintained
+        # when these levels are backtracked later. The first is already at the position 0
+        # and the other is moved to the position 1.
+        conflict_clause[1], conflict_clause[backtrack_pos] = conflict_clause[backtrack_pos], conflict_clause[1]
+        
+        # Increment the number of clauses and add the new clause
+        # (with its watchers at the start) to the clauses database
+        self._num_clauses += 1
+        self._clause_lits.extend(conflict_clause)
+        self._clause_off.append(len(self._clause_lits))
+        self._add_watches(clause_id)
         
-        # +++++++++++++++++++++++ NEED FOR THE ASSIGNMENT NODE ++++++++++++++++++++++++++++++++++
+        # +++++++++++++++++++++++ NEED FOR THE IMPLIED LITERAL ++++++++++++++++++++++++++++++++++
         # After backtracking, the added clause will imply that the conflict_level_literal should 
         # be true and so while backtracking, we add the clause as well as the assignment 
-        # node that satisfies the conflict_level_literal. This latest assigned node will then
+        # that satisfies the conflict_level_literal. This latest assignment will then
         # be used further to make more implications. This means when the new clause will be added, it 
-        # will be satisfied because of this new assigned node and that's why we coan easily set the 
+        # will be satisfied because of this new assignment and that's why we coan easily set the 
         # watchers as the first 2 literals as invariant is satisfied (because the clause is satisfied)
         
-        # If conflict_level_literal is negative, its variable should be set False,
-        # else it should be set True
-        value_to_set = True
-        if is_negative_conflict_lit:
-            value_to_set = False
-            
-        # Create an assignment node with conflict_level_var, value_to_set
-        # Set level as the backtrack level as ideally this is implied at that level
-        # Set clause as the clause_id representing the conflict clause as this implication
-        # is due to the conflict clause only
-        node = AssignedNode(conflict_level_var,value_to_set,backtrack_level,clause_id)
-        
         # Log if _is_log is true
-        if self._is_log:
+        if is_log:
             print("Backtracking to level ",backtrack_level)
-            print("Node after backtrack ",node)
+            print("Literal implied after backtrack ",conflict_level_literal)
         
-        # return the backtrack level and the assignment node
-        return backtrack_level,node
+        # return the backtrack level, the literal to be implied and
+        # the clause_id representing the conflict clause as this implication
+        # is due to the conflict clause only
+        # (The literal is implied at the backtrack level as ideally
+        # it is implied at that level)
+        return backtrack_level,conflict_level_literal,clause_id
     else:
         # If the clause has only one literal, then it is the one
         # assigned at the conflict level (the first UIP). In this case,
-        # we backtrack to level 0 and satisfy the conflict_level_literal
-        # by adding an assignment node
-        literal = conflict_clause[0]
-        var = self._get_var_from_literal(literal)
-        is_negative_literal = self._is_negative_literal(literal)
+        # we backtrack to level 0 and satisfy the literal
+        # (-1 is returned as the clause as this is implied by no
+        # stored clause (added to level 0))
+        return 0,conflict_clause[0],-1
+    
+# Add the method to the SAT class    
+SAT._analyze_conflict = analyze_conflict
+
+
+def bump_clause_vsids(self,conflict_clause):
+    '''
+    Method used as _bump_clause by the VSIDS decider. It increases the scores
+    of the literals of the conflict clause once it is learned.
+    
+    Parameters:
+        conflict_clause: the literals of the learned conflict clause
         
-        # Get the assignment node corresponding to the literal
-        assigned_node = self._variable_to_assignment_nodes[var]
+    Return:
+        None
+    '''
+    
+    # For all the literals appearing in the conflict clause,
+    # their score is increased by _incr
+    # (the increment, the scores and the update method are
+    # read once as local names for the whole clause)
+    incr = self._incr
+    lit_scores = self._lit_scores
+    increase_update = self._priority_queue.increase_update
+    for l in conflict_clause:
+        lit_scores[l] += incr
+        increase_update(l,incr)
+        
+    # Increase _incr by 0.75 to give more weightage
+    # to the recent conflict clausing literal
+    self._incr += 0.75
+
+# Add the method to the SAT class
+SAT._bump_clause_vsids = bump_clause_vsids
+
+
+def bump_clause_minisat(self,conflict_clause):
+    '''
+    Method used as _bump_clause by the MINISAT decider. It increases the scores
+    of the variables of the conflict clause once it is learned.
+    
+    Parameters:
+        conflict_clause: the literals of the learned conflict clause
         
-        # Backtrack to level 0
-        backtrack_level = 0
+    Return:
+        None
+    '''
+    
+    # For all variables corresponding to the 
+    # literals appearing in the clause, the
+    # scores are increased by _incr (read as local
+    # names as for VSIDS)
+    incr = self._incr
+    var_scores = self._var_scores
+    increase_update = self._priority_queue.increase_update
+    for l in conflict_clause:
+        var = l >> 1
+        var_scores[var] += incr
+        increase_update(var,incr)
+    
+    # To simulate the decay of all the previous var scores efficiently
+    # (so as to give more weightage to the recent conflict clausing variables),
+    # we divide the _incr by decay (instead of multiplying it to all the scores)
+    self._incr /= self._decay
+    
+    # As _incr grows after every conflict, it would overflow
+    # after enough conflicts. So, when it gets too large, all the
+    # scores (and the priorities in the priority queue) and _incr
+    # are scaled down by the same factor which keeps their order
+    # (The scores are scaled in one pass over the whole array
+    # which is replaced in place)
+    if self._incr > 1e100:
+        self._var_scores[:] = array("d",[score*1e-100 for score in self._var_scores])
+        self._priority_queue.decay_all(1e-100)
+        self._incr *= 1e-100
+
+# Add the method to the SAT class
+SAT._bump_clause_minisat = bump_clause_minisat
+
 
-        # If conflict_level_literal is negative, its variable should be set False,
-        # else it should be set True
-        value_to_set = True
-        if is_negative_literal:
-            value_to_set = False
+def bump_clause_ordered(self,conflict_clause):
+    '''
+    Method used as _bump_clause by the ORDERED decider. The ORDERED decider
+    keeps no scores, so nothing is done.
+    
+    Parameters:
+        conflict_clause: the literals of the learned conflict clause
         
-        # Create the node with var, value_to_set,backtrack_level(0)
-        # Clause is set to None as this is implied by no clause 
-        # (added to level 0)
-        node = AssignedNode(var,value_to_set,backtrack_level,None)
+    Return:
+        None
+    '''
+    pass
+
+# Add the method to the SAT class
+SAT._bump_clause_ordered = bump_clause_ordered
+
+
+def lit_redundant(self,literal,abstract_levels):
+    '''
+    Method to check if a literal of the conflict clause being learned is
+    implied by the other literals of the clause (so that it can be removed).
+    The literal is redundant if every literal of the clause implying its
+    variable is set at level 0, is marked (its variable is in the conflict
+    clause or was already found redundant) or is itself redundant, which is
+    checked in the same way (using a stack instead of recursion).
+    
+    Parameters:
+        literal: the literal (of an implied variable) of the conflict clause
+        abstract_levels: the levels of the literals of the conflict clause with
+        one bit set for every level (the bit level%32)
         
-        # return the backtrack level and the assignment node
-        return backtrack_level,node
+    Return:
+        True if the literal is redundant, else False
+    '''
     
-# Add the method to the SAT class    
-SAT._analyze_conflict = analyze_conflict
+    # Local names for the arrays used in the loop below
+    clause_lits = self._clause_lits
+    clause_off = self._clause_off
+    assign_level = self._assign_level
+    assign_reason = self._assign_reason
+    var_seen = self._var_seen
+    stamp = self._stamp
+    
+    # The literals whose implying clauses are to be checked and the
+    # variables marked by this check (they are unmarked if the literal
+    # is not redundant)
+    stack = [literal]
+    marked_vars = []
+    while stack:
+        var = stack.pop() >> 1
+        clause_id = assign_reason[var]
+        for pos in range(clause_off[clause_id],clause_off[clause_id+1]):
+            other_var = clause_lits[pos] >> 1
+            if var_seen[other_var] != stamp and assign_level[other_var] > 0:
+                if assign_reason[other_var] != -1 and (1 << (assign_level[other_var] & 31)) & abstract_levels:
+                    # If the variable is implied at a level of the conflict
+                    # clause, then it is marked and checked in the same way
+                    var_seen[other_var] = stamp
+                    stack.append(clause_lits[pos])
+                    marked_vars.append(other_var)
+                else:
+                    # Else the variable is decided (or is set at a level not in
+                    # the clause) and the literal is not redundant, so the
+                    # variables marked for it are unmarked
+                    for marked_var in marked_vars:
+                        var_seen[marked_var] = 0
+                    return False
+    
+    # All the variables reached are marked or set at level 0, so the
+    # literal is redundant (the variables marked here stay marked as
+    # they are implied by the clause as well)
+    return True
+
+# Add the method to the SAT class
+SAT._lit_redundant = lit_redundant
 
 
 # In[15]:
 
 
-def backtrack(self,backtrack_level,node_to_add):
+def backtrack(self,backtrack_level,literal_to_add,clause_to_add):
     '''
     Method used to backtrack the solver to the backtrack_level.
-    It also adds the node_to_add to the assignment stack.
+    It also makes the literal_to_add true and adds its variable to the assignment stack.
     
     Parameters:
         backtrack_level: the level to which the solver should backtrack(backjump)
-        node_to_add: the implication node implied by the conflict clause to be added
-        to the assignment stack at time of backtrack
+        literal_to_add: the literal implied by the conflict clause to be made true
+        at time of backtrack (-1 if there is no literal to add)
+        clause_to_add: the id of the clause implying literal_to_add (-1 if it is not stored)
         
     Return:
         None
@@ -1542,94 +1682,273 @@ def backtrack(self,backtrack_level,node_to_add):
     # sSet level of the solver to the backtrack_level
     self._level = backtrack_level
     
-    # Remove all nodes at level greater than the backtrack_level fromt 
-    # the assignment stack
-    itr = len(self._assignment_stack)-1
-    while True:
-        if itr<0:
-            # If the stack is empty, then break
-            break
-        if self._assignment_stack[itr].level <= backtrack_level: 
-            # If a node with level less than equal to backtrack_level
-            # is reached, then break
-            break
-        else:
-            # delete the node from the variable to node dictionary
-            del self._variable_to_assignment_nodes[self._assignment_stack[itr].var]
-            
-            # delete the node from the assignment stack
-            node = self._assignment_stack.pop(itr)
-            
-            # If VSIDS decider is used, then when we unset the 
-            # variables, we push the two literals correspoding
-            # to the unset variable back into the priority queue
-            # with their scores (priorities) as in the _lit_scores
-            # array
-            if self._decider == "VSIDS":
-                self._priority_queue.add(node.var,self._lit_scores[node.var])
-                self._priority_queue.add(node.var+self._num_vars,self._lit_scores[node.var+self._num_vars])
-            
-            # If MINISAT decider is used, then when we unset the 
-            # variables, we push the unset variable back into the  
-            # priority queue with their scores (priorities) as in 
-            # the _lit_scores array
-            if self._decider == "MINISAT":
-                self._priority_queue.add(node.var,self._var_scores[node.var])
-            
-            # delete the node itself
-            del node
-            
-            # move to the next node
-            itr -= 1
-    
-    if node_to_add:
-        # If node_to_add is not Nome
-        # node_to_add is None in case when backtrack is used to restart the solver
-        
-        # Add the implied node to the variable to nodes dictionary
-        self._variable_to_assignment_nodes[node_to_add.var] = node_to_add
-
-        # Add the implied node to the assignment stack and
-        # update the node's index to the position in the
-        # stack at which it is pushed
-        self._assignment_stack.append(node_to_add)
-        node_to_add.index = len(self._assignment_stack)-1
-
-        # If VSIDS decider is used, then when we assign the variable,
-        # we remove the two literals corresponing to the variable
-        # as in the priority queue, we always keep the unassigned
-        # literals
-        if self._decider == "VSIDS":
-            self._priority_queue.remove(node_to_add.var)
-            self._priority_queue.remove(node_to_add.var+self._num_vars)
-
-        # If MINISAT decider is used
-        if self._decider == "MINISAT":
-            # Remove the assigned variable from the
-            # priority queue as we keep only unassigned
-            # variables in it
-            self._priority_queue.remove(node_to_add.var)
-
-            # Use the set value to update the
-            # phase of the variable
-            if node_to_add.value == False:
-                self._phase[node_to_add.var] = 0
-            else:
-                self._phase[node_to_add.var] = 1
+    # Local names for the trail and the levels of the variables
+    trail = self._trail
+    assign_level = self._assign_level
+    
+    # Remove all variables at level greater than the backtrack_level fromt 
+    # the assignment stack by moving the head of the trail below them
+    # (The trail has the variables in the order of their levels, so
+    # they are all at the top of it)
+    old_trail_head = self._trail_head
+    trail_head = old_trail_head
+    while trail_head > 0 and assign_level[trail[trail_head-1]] > backtrack_level:
+        trail_head -= 1
+    self._trail_head = trail_head
+    
+    # The variables removed above (they are still stored in the trail
+    # after its new head)
+    unset_vars = trail[trail_head:old_trail_head]
+    
+    # Unassign the variables (their level, reason and index
+    # are not read till they are assigned again) and put them
+    # back in the priority queue as the decider used does
+    self._unassign_vars(unset_vars)
+
+    # The variables after the new trail head are unset, so the
+    # propagation head is moved back to it if it is ahead (the
+    # literal added below is then the first one propagated)
+    if self._prop_head > self._trail_head:
+        self._prop_head = self._trail_head
+    
+    if literal_to_add != -1:
+        # If literal_to_add is not -1
+        # literal_to_add is -1 in case when backtrack is used to restart the solver
+        
+        # If the literal is negative, its variable should be set False (0),
+        # else it should be set True (1)
+        var = literal_to_add >> 1
+        value_to_set = (literal_to_add & 1) ^ 1
+        
+        # Assign the variable at the backtrack level with clause_to_add as the reason
+        # and push it to the assignment stack
+        self._assign(var,value_to_set,backtrack_level,clause_to_add)
+
+        # (The variable stays in the priority queue and is skipped
+        # by decide when it reaches the top, and its phase is
+        # saved when it is unset)
 
         # Increment the number of implications made 
         # in the stats object to count this implication
-        # node
+        # assignment
         self.stats._num_implications += 1
 
 # Add the method to the SAT class
 SAT._backtrack = backtrack
 
 
+def unassign_vars_vsids(self,unset_vars):
+    '''
+    Method used as _unassign_vars by the VSIDS decider. It saves the phase of
+    the variables removed from the assignment stack by backtrack and unassigns them.
+    
+    Parameters:
+        unset_vars: the variables to be unassigned
+        
+    Return:
+        None
+    '''
+    
+    # The phase of every variable unset is saved first (as for MINISAT)
+    assign_value = self._assign_value
+    phase = self._phase
+    for var in unset_vars:
+        phase[var] = assign_value[var]
+        assign_value[var] = -1
+    
+    # When we unset the variables, we push the literals
+    # correspoding to the unset variables back into the priority
+    # queue with their scores (priorities) as in the _lit_scores array.
+    # Only the literals that were popped by decide are pushed, as the
+    # assigned ones are not removed otherwise (lazy deletion).
+    # They are added together so that the heap is rebuilt
+    # at once if many are added (eg. at a restart)
+    contains = self._priority_queue.contains
+    literals = []
+    for var in unset_vars:
+        if not contains(var<<1):
+            literals.append(var<<1)
+        if not contains((var<<1)|1):
+            literals.append((var<<1)|1)
+    self._priority_queue.add_all(literals,[self._lit_scores[lit] for lit in literals])
+
+# Add the method to the SAT class
+SAT._unassign_vars_vsids = unassign_vars_vsids
+
+
+def unassign_vars_minisat(self,unset_vars):
+    '''
+    Method used as _unassign_vars by the MINISAT decider. It saves the phase of
+    the variables removed from the assignment stack by backtrack and unassigns them.
+    
+    Parameters:
+        unset_vars: the variables to be unassigned
+        
+    Return:
+        None
+    '''
+    
+    # The phase of every variable unset is saved first. The value a
+    # variable has when it is unset is the last value assigned to it, so
+    # the phase is saved here once instead of at every assignment (a
+    # variable is decided only when it is unassigned, so decide always
+    # reads the value last assigned to it)
+    assign_value = self._assign_value
+    phase = self._phase
+    for var in unset_vars:
+        phase[var] = assign_value[var]
+        assign_value[var] = -1
+    
+    # When we unset the variables, we push the unset variables which
+    # are not in the priority queue back into it with their scores
+    # (priorities) as in the _var_scores array (together as for VSIDS)
+    contains = self._priority_queue.contains
+    popped_vars = [var for var in unset_vars if not contains(var)]
+    self._priority_queue.add_all(popped_vars,[self._var_scores[var] for var in popped_vars])
+
+# Add the method to the SAT class
+SAT._unassign_vars_minisat = unassign_vars_minisat
+
+
+def unassign_vars_ordered(self,unset_vars):
+    '''
+    Method used as _unassign_vars by the ORDERED decider. It unassigns the
+    variables removed from the assignment stack by backtrack.
+    
+    Parameters:
+        unset_vars: the variables to be unassigned
+        
+    Return:
+        None
+    '''
+    
+    assign_value = self._assign_value
+    for var in unset_vars:
+        assign_value[var] = -1
+
+# Add the method to the SAT class
+SAT._unassign_vars_ordered = unassign_vars_ordered
+
+
+# ## Reducing the Learned Clause Database
+# 
+# Every conflict adds a learned clause, so the clause database keeps growing and BCP has to visit more and more watches. So, the learned clauses that are not useful are removed periodically (as done by the Glucose solver). The usefulness of a learned clause is measured by its LBD (Literal Block Distance), the number of different levels of its literals when it is learned. A clause with a small LBD connects few levels and tends to be used in the implications again and again. The reduction is done for the first time after 2000 clauses are learned and the gap between two reductions grows by 300 every time. Each reduction removes the half of the learned clauses with the highest LBD (the older one first among the clauses with the same LBD). The clauses with the LBD at most 2 are never removed, nor are the clauses implying a variable which is assigned at the moment (they are locked as their ids are used as reasons). The remaining learned clauses are stored again one after the other and only their watches are created again (the clauses of the input file keep their ids and their watches).
+
+# In[16]:
+
+
+def reduce_db(self):
+    '''
+    Method to remove the learned clauses with the high LBD from the clause database
+    (as discussed above). The learned clauses kept are renumbered, so the reasons of the assigned
+    variables are updated and the watches of the learned clauses are created again.
+    
+    Parameters:
+        None
+        
+    Return:
+        None
+    '''
+    
+    # The learned clauses are stored from the id first_learned_clause
+    first_learned_clause = self._first_learned_clause
+    learned_lbd = self._learned_lbd
+    assign_reason = self._assign_reason
+    trail = self._trail
+    
+    # The clauses implying the assigned variables are locked
+    locked = {assign_reason[trail[i]] for i in range(0,self._trail_head)}
+    
+    # The learned clauses that can be removed sorted by their LBD from the
+    # highest (the sort is stable, so the older clauses come first for
+    # the same LBD). Half of all the learned clauses are removed (or all
+    # of these if they are fewer)
+    candidates = [clause_id for clause_id in range(first_learned_clause,self._num_clauses)
+                  if learned_lbd[clause_id-first_learned_clause] > 2 and clause_id not in locked]
+    candidates.sort(key=lambda clause_id: -learned_lbd[clause_id-first_learned_clause])
+    deleted = set(candidates[:(self._num_clauses-first_learned_clause)//2])
+    
+    # Store the clauses of the input file as they are and the learned clauses
+    # kept one after the other in the new arrays. new_id[c-first_learned_clause]
+    # is the new id of the learned clause with the id c
+    clause_lits = self._clause_lits
+    clause_off = self._clause_off
+    new_clause_lits = clause_lits[:clause_off[first_learned_clause]]
+    new_clause_off = clause_off[:first_learned_clause+1]
+    new_learned_lbd = array("i")
+    new_id = [-1]*(self._num_clauses-first_learned_clause)
+    for clause_id in range(first_learned_clause,self._num_clauses):
+        if clause_id not in deleted:
+            new_id[clause_id-first_learned_clause] = len(new_clause_off)-1
+            new_clause_lits.extend(clause_lits[clause_off[clause_id]:clause_off[clause_id+1]])
+            new_clause_off.append(len(new_clause_lits))
+            new_learned_lbd.append(learned_lbd[clause_id-first_learned_clause])
+    self._clause_lits = new_clause_lits
+    self._clause_off = new_clause_off
+    self._learned_lbd = new_learned_lbd
+    self._num_clauses = len(new_clause_off)-1
+    
+    # Update the reasons of the assigned variables implied by the learned clauses
+    # (these are locked, so they are all kept)
+    for i in range(0,self._trail_head):
+        var = trail[i]
+        if assign_reason[var] >= first_learned_clause:
+            assign_reason[var] = new_id[assign_reason[var]-first_learned_clause]
+    
+    # The ids of the clauses of the input file do not change, so their watch
+    # cells (and blockers) stay as they are. Only the cells of the learned
+    # clauses (from the cell first_learned_cell) are unlinked from the watch
+    # lists of the literals watching the old learned clauses
+    first_learned_cell = 2*first_learned_clause
+    watch_head = self._watch_head
+    watch_next = self._watch_next
+    watching = set(clause_lits[clause_off[clause_id]+watch_pos]
+                   for clause_id in range(first_learned_clause,first_learned_clause+len(new_id))
+                   for watch_pos in range(0,2))
+    for literal in watching:
+        # Relink the cells of the clauses of the input file of this
+        # list in the same order, skipping the learned ones
+        prev_cell = -1
+        cell = watch_head[literal]
+        while cell != -1:
+            if cell < first_learned_cell:
+                if prev_cell == -1:
+                    watch_head[literal] = cell
+                else:
+                    watch_next[prev_cell] = cell
+                prev_cell = cell
+            cell = watch_next[cell]
+        if prev_cell == -1:
+            watch_head[literal] = -1
+        else:
+            watch_next[prev_cell] = -1
+    
+    # Drop the learned cells and watch the learned clauses kept under their
+    # new ids (the watchers of every clause are at its first 2 positions,
+    # so the invariant still holds for them)
+    del watch_next[first_learned_cell:]
+    del self._watch_blocker[first_learned_cell:]
+    for clause_id in range(first_learned_clause,self._num_clauses):
+        self._add_watches(clause_id)
+    
+    # Count the removed clauses in the stats object and set the
+    # number of learned clauses for the next reduction
+    self.stats._num_deleted_clauses += len(deleted)
+    self._next_reduce += self._reduce_gap
+    self._reduce_gap += 300
+    
+    # Log if _is_log is true
+    if self._is_log:
+        print("Reduced the clause database by {} clauses".format(len(deleted)))
+
+# Add the method to the SAT class
+SAT._reduce_db = reduce_db
+
+
 # The solve method implemented in the next cell is the main method which calls all the methods implemented
 # above and solves the SAT problem.
 
-# In[16]:
+# In[17]:
 
 
 def solve(self,cnf_filename):
@@ -1665,6 +1984,10 @@ def solve(self,cnf_filename):
     self.stats._num_vars = self._num_vars
     self.stats._num_clauses = self._num_clauses
     
+    # The clauses learned while solving are stored after the
+    # clauses of the input file
+    self._first_learned_clause = self._num_clauses
+    
 
     if self.stats._result == "UNSAT":
         # The case where implications from the unary clauses
@@ -1677,8 +2000,10 @@ def solve(self,cnf_filename):
     else:
         # We now solve the SAT problem
         
-        # Indicating that BCP runs first time
-        first_time = True
+        # Whether the time spent in each phase is measured
+        # (the time is measured with the high resolution
+        # perf_counter only if profiling is on)
+        profile = self._profile
 
         # The main alogrithm loop
         while True:
@@ -1688,11 +2013,13 @@ def solve(self,cnf_filename):
             while True:
 
                 # Perform the BCP and store its return value in result
-                temp = time.time()
-                result = self._boolean_constraint_propogation(first_time)
+                if profile:
+                    temp = time.perf_counter()
+                result = self._boolean_constraint_propogation()
 
                 # Increase the time spend in BCP (stored in the stats object)
-                self.stats._bcp_time += time.time()-temp
+                if profile:
+                    self.stats._bcp_time += time.perf_counter()-temp
 
                 # Break if no conflict
                 if result == "NO_CONFLICT":
@@ -1706,20 +2033,21 @@ def solve(self,cnf_filename):
                     # (As the level 0 decisions and implications are ones
                     # due to the unary clauses and so are fixed)
                     # So, we backtrack to level 0 to restart the solver
-                    self._backtrack(0,None)
-                    break
-
-                # Set first_time to False as we want it 
-                # to be true only once initially
-                first_time = False
+                    # (BCP is run again as some level 0 variables may not
+                    # have been propagated, it returns "NO_CONFLICT" at once
+                    # if all of them are)
+                    self._backtrack(0,-1,-1)
+                    continue
 
                 # If there is a conflict, call _analyze_conflict method to 
                 # analyze it
-                temp = time.time()
-                backtrack_level, node_to_add = self._analyze_conflict()
+                if profile:
+                    temp = time.perf_counter()
+                backtrack_level, literal_to_add, clause_to_add = self._analyze_conflict()
 
                 # Increase the time spend in analyzing (stored in the stats object)
-                self.stats._analyze_time += time.time()-temp
+                if profile:
+                    self.stats._analyze_time += time.perf_counter()-temp
 
                 # If backtrack level is -1, it means a conflict at level 0,
                 # so the problem is UNSAT.
@@ -1739,33 +2067,38 @@ def solve(self,cnf_filename):
                     break
 
                 # Backtrack to the backtrack_level
-                # node_to_add is added to the assignment stack in this
-                # method and this woll be used to get further implications
+                # literal_to_add is made true in this method
+                # and this woll be used to get further implications
                 # when _boolean_constraint_propogation is called again in 
                 # the next iteration
-                temp = time.time()
-                self._backtrack(backtrack_level,node_to_add)
+                if profile:
+                    temp = time.perf_counter()
+                self._backtrack(backtrack_level,literal_to_add,clause_to_add)
 
                 # Increase the time spend in backtracking (stored in the stats object)
-                self.stats._backtrack_time += time.time()-temp
+                if profile:
+                    self.stats._backtrack_time += time.perf_counter()-temp
+                
+                # Reduce the learned clause database if enough clauses
+                # have been learned since the last reduction
+                if self.stats._num_learned_clauses >= self._next_reduce:
+                    self._reduce_db()
             
             if self.stats._result == "UNSAT":
                 # Means that problem was proved to be UNSAT during BCP
                 # so we break out of the external loop
                 break
-            
-            # Set first_time to False as we want it 
-            # to be true only once initially
-            first_time = False
 
             # If all possible implications are made without conflicts,
             # then the solver decides on an unassigned variable
             # using the _decide method
-            temp = time.time()
+            if profile:
+                temp = time.perf_counter()
             var_decided = self._decide()
 
             # Increase the time spend in deciding (stored in the stats object)
-            self.stats._decide_time += time.time()-temp
+            if profile:
+                self.stats._decide_time += time.perf_counter()-temp
 
             if var_decided == -1:
                 # If var_decided is -1, it means all the variables
@@ -1812,20 +2145,15 @@ def solve(self,cnf_filename):
     
     # Writing the stats to the stats file
     
-    # Store the original standard output 
-    original_stdout = sys.stdout
-    
-    # Set the standard output to point to the stats file
-    sys.stdout = open(stats_file_name,"wt")
-    
-    # Call the print stats which actually writes in 
-    # the file as standard output is directed towards the 
-    # stats file
-    self.stats.print_stats()
+    # Build the whole statistics text in memory so that the
+    # file is written with a single write instead of one
+    # small write for every printed line
+    stats_buffer = io.StringIO()
+    self.stats.print_stats(file=stats_buffer)
     
-    # Restore the standard output once the stats file is
-    # written
-    sys.stdout = original_stdout
+    # Write the statistics text to the stats file
+    with open(stats_file_name,"wt") as stats_file:
+        stats_file.write(stats_buffer.getvalue())
     
     if self.stats._result == "SAT":
         # If the problem is SAT
@@ -1842,20 +2170,17 @@ def solve(self,cnf_filename):
         # value
         assignment_dict = {}
         
-        # Traverse the _variable_to_assignment_nodes and for each variable
+        # Traverse the _assign_value array and for each assigned variable
         # store its set value in assignment_dict
-        for var in self._variable_to_assignment_nodes:
-            assignment_dict[var] = self._variable_to_assignment_nodes[var].value
-        
-        # Open the assignment file
-        assgn_file = open(assgn_file_name,"w")
-        
-        # Write the dictionary into the file by
-        # serializing it through json.dumps() method
-        assgn_file.write(json.dumps(assignment_dict))
-        
-        # Close the assignment file
-        assgn_file.close
+        for var in range(1,self._num_vars+1):
+            if self._assign_value[var] != -1:
+                assignment_dict[var] = self._assign_value[var] == 1
+        
+        # Write the dictionary into the assignment file by
+        # serializing it through json.dumps() method (the file
+        # is closed once it is written)
+        with open(assgn_file_name,"w") as assgn_file:
+            assgn_file.write(json.dumps(assignment_dict))
         
     
 # Add the method to the SAT class
@@ -25,16 +25,25 @@ if __name__ == "__main__":
     # the input problem
     input_file_name = sys.argv[4]
 
+    # option whether to measure the time spent in
+    # each phase (optional, False if not passed)
+    to_profile = False
+    if len(sys.argv) > 5:
+        if sys.argv[5] == "True":
+            to_profile = True
+        elif sys.argv[5] != "False":
+            raise ValueError("The fifth argument should be either True or False.")
+
     if restarter_to_use == "None":
         # If no restart strategy is to be used
 
-        sat = SAT(to_log,decider_to_use)
+        sat = SAT(to_log,decider_to_use,profile=to_profile)
         sat.solve(input_file_name)
         sat.stats.print_stats()
     else:
         # If a restart strategy is specified
 
-        sat = SAT(to_log,decider_to_use,restarter_to_use)
+        sat = SAT(to_log,decider_to_use,restarter_to_use,profile=to_profile)
         sat.solve(input_file_name)
         sat.stats.print_stats()
 
@@ -14,7 +14,8 @@ def check_validity(input_file_name,assgn_dict):
 
     Parameters:
         input_file_name: Name of the input file storing the SAT problem
-        assgn_dict: the dictionary storing the mapping of variables to the
+        assgn_dict: the dictionary storing the mapping of variables (as ints
+        or as strings, like the keys of the JSON assignment file) to the
         assigned boolean values
 
     Return:
@@ -23,20 +24,27 @@ def check_validity(input_file_name,assgn_dict):
         is not a satisfying assignment
     """
 
+    # Convert the variables to ints once here (they are
+    # strings if the dictionary was loaded from JSON)
+    assgn_dict = {int(var): value for var,value in assgn_dict.items()}
+
     # Open the input file
     input_file = open(input_file_name,"r")
     
     # Value to be returned
     is_correct = True
 
-    # For all lines in the file
-    for line in input_file.readlines():
-        # Remove trailing characters at the end of the line using rstrip
-        line = line.rstrip()
-        
+    # For all lines in the file (read one at a time
+    # instead of reading the whole file at once)
+    for line in input_file:
         # Split the line with space as delimiter
+        # (this also removes the trailing characters)
         line = line.split()
         
+        if not line:
+            # Ignore the empty lines
+            continue
+        
         # First word of the line
         first_word = line[0]
         
@@ -46,33 +54,15 @@ def check_validity(input_file_name,assgn_dict):
             continue
         else:
 
-            # Satisfiability of this clause
-            clause_sat = False
-
             # Remove the end 0 as in the DIMACS
             # CNF file
             clause = line[:-1]
 
-            # For all literals in the clause
-            for lit in clause:
-                if lit[0] == "-":
-                    # If the litteral is negative
-                    var = lit[1:]
-
-                    # Value read from the assignement
-                    # dictionary is reversed
-                    value = not assgn_dict[str(var)]
-                else:
-                    # Value is read from the assignment
-                    # dictionary
-                    value = assgn_dict[str(lit)]
-                
-                # OR is performed
-                clause_sat = clause_sat or value
-                
-                # We break if the clause is already satisfied
-                if clause_sat:
-                    break
+            # The clause is satisfied if any of its literals is true.
+            # The value of a literal is the value of its variable read
+            # from the assignment dictionary, reversed (by XOR with True)
+            # if the literal is negative. any stops at the first true literal.
+            clause_sat = any(assgn_dict[abs(lit)] ^ (lit < 0) for lit in map(int,clause))
             
             # If the clause is not satisfied,
             # we set is_correct to False and